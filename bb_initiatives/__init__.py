@@ -0,0 +1,17 @@
+# bb_initiatives/__init__.py
+#
+# Buy & Build initiatives analysis. Importing the package (taxonomy and classifiers) does no
+# I/O and does not import pandas; the pipelines are in bb_initiatives.overview and
+# bb_initiatives.targets, and `python -m bb_initiatives` runs them.
+
+from .batch import classify_companies
+from .classify import (find_matching_segment, find_matching_target_segment, identify_subcategory,
+                       identify_target_subcategory, overview_classifier, target_classifier)
+from .taxonomy import nace_to_subcategory_map, segments_data, subcategory_keywords, target_subcategory_keywords
+
+__all__ = [
+    'classify_companies',
+    'find_matching_segment', 'find_matching_target_segment', 'identify_subcategory', 'identify_target_subcategory',
+    'overview_classifier', 'target_classifier',
+    'nace_to_subcategory_map', 'segments_data', 'subcategory_keywords', 'target_subcategory_keywords',
+]
@@ -0,0 +1,99 @@
+# batch.py
+#
+# Streaming classification: records in, (id, Segment, Subcategory) out. Records are classified in
+# batches with the compiled taxonomy and results are yielded as each batch is done, so any number
+# of records goes through in constant memory, without pandas.
+
+import csv
+import itertools
+import json
+
+from .classify import overview_classifier, target_classifier
+
+# Records classified per batch (batches of PARALLEL_MIN_ROWS or more can use a process pool)
+BATCH_SIZE = 5000
+
+ID_FIELD = 'Company ID'
+KEYWORDS_FIELD = 'Keywords'
+DESCRIPTION_FIELD = 'Description'
+
+RULES = ('overview', 'targets')
+
+
+def _field_row(text, missing):
+    # Like frame_rows: missing values read as 'nan' (str(NaN)), absent fields as ''
+    if missing:
+        return 'nan'
+    return str(text).lower()
+
+
+def record_row(record, keywords_field=KEYWORDS_FIELD, description_field=DESCRIPTION_FIELD):
+    """Classifier input row of one record (a mapping); None values are missing, as NaN cells are in a DataFrame."""
+    keywords = record.get(keywords_field, '')
+    description = record.get(description_field, '')
+    return (_field_row(keywords, keywords is None), _field_row(description, description is None),
+            keywords is None, description is None)
+
+
+def rules_classifier(rules='overview'):
+    """The compiled classifier of the overview ('overview') or of the target mapping ('targets')."""
+    if rules not in RULES:
+        raise ValueError(f"Unknown rules {rules!r}; expected one of {RULES}")
+    return target_classifier() if rules == 'targets' else overview_classifier()
+
+
+def classify_companies(records, batch_size=BATCH_SIZE, rules='overview', id_field=ID_FIELD,
+                       keywords_field=KEYWORDS_FIELD, description_field=DESCRIPTION_FIELD, workers=1):
+    """Yields (id, segment, subcategory) for each record (a mapping), in input order.
+
+    Records without `id_field`, or with a blank one (None or ''), are
+    identified by their position in the input (from 0). At most `batch_size`
+    records are held at a time; `workers` > 1 classifies batches of
+    PARALLEL_MIN_ROWS or more in a process pool.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    classifier = rules_classifier(rules)
+    numbered = enumerate(records)
+    while True:
+        batch = list(itertools.islice(numbered, batch_size))
+        if not batch:
+            return
+        rows = [record_row(record, keywords_field, description_field) for _, record in batch]
+        segments, subcategories = classifier.classify_rows(rows, workers=workers)
+        for (position, record), segment, subcategory in zip(batch, segments, subcategories):
+            record_id = record.get(id_field)
+            yield (position if record_id is None or record_id == '' else record_id), segment, subcategory
+
+
+def read_csv_records(stream):
+    """Records of a CSV stream with a header row; empty fields are missing (None), as in a workbook."""
+    for record in csv.DictReader(stream):
+        yield {field: (value if value != '' else None) for field, value in record.items()}
+
+
+def read_jsonl_records(stream):
+    """Records of a JSON Lines stream (one object per line; blank lines are skipped)."""
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {line_number}: expected a JSON object, got {type(record).__name__}")
+        yield record
+
+
+def write_csv_results(results, stream, id_field=ID_FIELD):
+    writer = csv.writer(stream)
+    writer.writerow([id_field, 'Segment', 'Subcategory'])
+    writer.writerows(results)
+
+
+def write_jsonl_results(results, stream, id_field=ID_FIELD):
+    for record_id, segment, subcategory in results:
+        stream.write(json.dumps({id_field: record_id, 'Segment': segment, 'Subcategory': subcategory},
+                                ensure_ascii=False) + '\n')
+
+
+READERS = {'csv': read_csv_records, 'jsonl': read_jsonl_records}
+WRITERS = {'csv': write_csv_results, 'jsonl': write_jsonl_results}
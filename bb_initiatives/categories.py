@@ -0,0 +1,32 @@
+# categories.py
+
+import pandas as pd
+
+
+def taxonomy_categories(*label_groups):
+    """One sorted category set from several label lists (taxonomy labels, defaults, NACE mappings).
+
+    Sorted, so sorting or grouping a categorical column gives the same order as
+    the plain strings would.
+    """
+    return sorted({label for labels in label_groups for label in labels if label is not None})
+
+
+def as_categorical(values, categories, index=None):
+    """`values` as a categorical Series over the fixed `categories`.
+
+    Raises ValueError for a value outside the set instead of turning it into NaN.
+    """
+    values = pd.Series(values, index=index)
+    result = values.astype(pd.CategoricalDtype(categories))
+    unknown = result.isna() & values.notna()
+    if unknown.any():
+        raise ValueError(f"Values outside the category set: {sorted(set(values[unknown].astype(str)))[:5]}")
+    return result
+
+
+def counts_by_appearance(values):
+    """`value_counts` of a categorical column as for a string column: only values that
+    occur, most frequent first, equal counts in order of first appearance."""
+    counts = values.value_counts(sort=False)
+    return counts.reindex(pd.unique(values.dropna())).sort_values(ascending=False, kind='stable')
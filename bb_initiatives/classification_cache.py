@@ -0,0 +1,107 @@
+# classification_cache.py
+
+import hashlib
+import sqlite3
+
+# Default cache file, created next to the Excel inputs in the working directory
+CLASSIFICATION_CACHE_FILE = 'classification_cache.sqlite'
+
+# Max number of keys per "IN (...)" query (stays below SQLite's host parameter limit)
+_QUERY_BATCH = 500
+
+
+def _row_key(segments_fingerprint, row):
+    """Hash of (Keywords, Description, taxonomy fingerprint) for one normalized row."""
+    keywords_text, description_text, keywords_missing, description_missing = row
+    # Missing fields are hashed as '\0' so they never collide with the literal text 'nan'
+    keywords_part = '\0' if keywords_missing else keywords_text
+    description_part = '\0' if description_missing else description_text
+    payload = f"{segments_fingerprint}\x1f{keywords_part}\x1f{description_part}"
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+
+
+class ClassificationCache:
+    """On-disk SQLite cache mapping company text to its (Segment, Subcategory).
+
+    Entries are keyed by a hash of the keywords, the description and the segment
+    rules of the taxonomy (segment keywords, their order and the matching mode), so
+    editing a segment keyword reclassifies everything. Each entry also stores the
+    fingerprint of the subcategory rules of its segment: editing a subcategory
+    keyword or default only reclassifies companies in that segment.
+    """
+
+    def __init__(self, path=CLASSIFICATION_CACHE_FILE):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            """CREATE TABLE IF NOT EXISTS classifications (
+                   key BLOB PRIMARY KEY,
+                   segment TEXT NOT NULL,
+                   subcategory TEXT NOT NULL,
+                   subcategory_fingerprint TEXT NOT NULL
+               )"""
+        )
+        self.connection.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, keys):
+        found = {}
+        for i in range(0, len(keys), _QUERY_BATCH):
+            batch = keys[i:i + _QUERY_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            cursor = self.connection.execute(
+                f"SELECT key, segment, subcategory, subcategory_fingerprint FROM classifications WHERE key IN ({placeholders})",
+                batch,
+            )
+            for key, segment, subcategory, subcategory_fingerprint in cursor:
+                found[key] = (segment, subcategory, subcategory_fingerprint)
+        return found
+
+    def classify_rows(self, classifier, rows, workers=1):
+        """Classifies normalized rows, reusing cached results that are still valid."""
+        keys = [_row_key(classifier.segments_fingerprint, row) for row in rows]
+        unique_keys = list(dict.fromkeys(keys))
+        cached = self._lookup(unique_keys)
+
+        results = {}
+        stale = {}  # key -> row, for texts that are new or whose cached result is outdated
+        for key, row in zip(keys, rows):
+            if key in results or key in stale:
+                continue
+            entry = cached.get(key)
+            if entry is not None and entry[2] == classifier.subcategory_fingerprints.get(entry[0]):
+                results[key] = (entry[0], entry[1])
+            else:
+                stale[key] = row
+
+        segments, subcategories = classifier.classify_rows(list(stale.values()), workers=workers)
+        to_store = []
+        for key, segment, subcategory in zip(stale, segments, subcategories):
+            results[key] = (segment, subcategory)
+            to_store.append((key, segment, subcategory, classifier.subcategory_fingerprints.get(segment, '')))
+
+        self.misses += len(to_store)
+        self.hits += len(results) - len(to_store)
+        if to_store:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO classifications (key, segment, subcategory, subcategory_fingerprint) VALUES (?, ?, ?, ?)",
+                to_store,
+            )
+            self.connection.commit()
+
+        segments = [results[key][0] for key in keys]
+        subcategories = [results[key][1] for key in keys]
+        return segments, subcategories
+
+    def close(self):
+        self.connection.close()
+
+
+def open_classification_cache(path=CLASSIFICATION_CACHE_FILE):
+    """Opens the cache, or returns None (classify without caching) if the file can't be used."""
+    try:
+        return ClassificationCache(path)
+    except sqlite3.Error as e:
+        print(f"Warning: Could not open classification cache '{path}': {e}")
+        return None
@@ -0,0 +1,88 @@
+# classify.py
+#
+# Segment/subcategory classifiers of the B&B overview and of the target mapping.
+# Importing this module does no I/O; the compiled classifiers are built on first use.
+
+import functools
+
+from .keyword_matcher import KeywordMatcher, TaxonomyClassifier, compiled_matcher, first_word_subcategory
+from .taxonomy import segments_data, subcategory_keywords, target_subcategory_keywords
+
+
+# --- B&B overview: substring matching, default subcategory from the segment name ---
+
+def find_matching_segment(row, segments_data=segments_data):
+    """Segment of a company row (Keywords + Description); the first matching segment wins."""
+    text_to_search = f"{str(row['Keywords']).lower()} {str(row['Description']).lower()}"
+    # Single scan of the text with the compiled taxonomy; first matching segment wins
+    return compiled_matcher(segments_data).first_match(text_to_search, "Other")
+
+
+def identify_subcategory(text, segment):
+    """Subcategory of `text` within `segment`; defaults to the first word of the segment name."""
+    default_subcategory = first_word_subcategory(segment)
+
+    if not text or not isinstance(text, str):
+        return default_subcategory
+
+    text = text.lower()
+
+    # Get subcategory definitions for this segment (first matching subcategory wins)
+    if segment in subcategory_keywords:
+        return compiled_matcher(subcategory_keywords[segment]).first_match(text, default_subcategory)
+
+    return default_subcategory
+
+
+@functools.lru_cache(maxsize=None)
+def overview_classifier():
+    """Combined classifier of the overview: Segment and Subcategory from one scan of each
+    company's text. Subcategories are matched on "description keywords", like identify_subcategory."""
+    return TaxonomyClassifier(
+        segments_data, subcategory_keywords,
+        default_subcategory=first_word_subcategory,
+        subcategory_text='description_first'
+    )
+
+
+# --- Target mapping: whole-word matching, 'General' as the default subcategory ---
+
+def find_matching_target_segment(row, segments_data=segments_data):
+    """Segment of a target row from whole-word keyword matches (first in dictionary order)."""
+    text_to_search = f"{str(row.get('Keywords', '')).lower()} {str(row.get('Description', '')).lower()}"
+    matcher = compiled_matcher(segments_data, word_boundary=True)
+    return matcher.first_match(text_to_search, "Other")  # Default if no keywords match
+
+
+@functools.lru_cache(maxsize=None)
+def _specific_subcategory_matchers():
+    # Compiled matchers for the specific subcategories of each segment ('General' is only the fallback)
+    return {
+        segment: KeywordMatcher({k: v for k, v in subcategories.items() if k != 'General'}, word_boundary=True)
+        for segment, subcategories in target_subcategory_keywords.items()
+    }
+
+
+def identify_target_subcategory(text, segment):
+    """Subcategory of `text` within `segment` from whole-word matches; defaults to 'General'."""
+    default_subcategory = 'General'
+
+    if not text or not isinstance(text, str):
+        return default_subcategory
+
+    text_lower = text.lower()
+
+    # Check specific subcategories of this segment (whole-word matches, 'General' excluded)
+    matchers = _specific_subcategory_matchers()
+    if segment in matchers:
+        return matchers[segment].first_match(text_lower, default_subcategory)
+
+    return default_subcategory
+
+
+@functools.lru_cache(maxsize=None)
+def target_classifier():
+    """Combined classifier of the target mapping: one whole-word scan of "keywords description"."""
+    return TaxonomyClassifier(
+        segments_data, target_subcategory_keywords, word_boundary=True, skip_subcategories=('General',)
+    )
@@ -0,0 +1,108 @@
+# cli.py
+#
+# `python -m bb_initiatives <command>`. The lookup commands (classify-text, classify-batch, nace-lookup) only
+# import the taxonomy and classifiers; pandas and numpy are imported by the pipeline commands
+# (overview, targets) and the service (serve) alone, when they run.
+
+import argparse
+import importlib
+import sys
+
+# Pipeline commands (and the service): module and help text. Their options are parsed by the module's own main()
+PIPELINES = {
+    'overview': ('.overview', "Classify B&B platforms/add-ons and build the initiatives overview."),
+    'targets': ('.targets', "Map potential targets to B&B initiatives."),
+    'serve': ('.service', "Answer classification and matching requests over local HTTP."),
+}
+
+
+def classify_text(args):
+    """Prints Segment and Subcategory of each description (tab-separated, after the text)."""
+    from .classify import overview_classifier, target_classifier
+
+    classifier = target_classifier() if args.rules == 'targets' else overview_classifier()
+    for text in args.texts:
+        segment, subcategory = classifier.classify(args.keywords, text)
+        print(f"{text}\t{segment}\t{subcategory}")
+
+
+def classify_batch(args):
+    """Classifies CSV or JSON Lines records from a file or stdin; writes the results in the same format."""
+    from .batch import READERS, WRITERS, classify_companies
+
+    output_format = args.output_format or args.format
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8', newline='')
+    try:
+        results = classify_companies(
+            READERS[args.format](source), batch_size=args.batch_size, rules=args.rules, id_field=args.id_field,
+            keywords_field=args.keywords_field, description_field=args.description_field, workers=args.workers,
+        )
+        WRITERS[output_format](results, sys.stdout, id_field=args.id_field)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def nace_lookup(args):
+    """Prints Segment and Subcategory of each NACE code (tab-separated, after the code)."""
+    from .nace_lookup import get_subcategory_from_nace
+
+    for code in args.codes:
+        segment, subcategory = get_subcategory_from_nace(code)
+        if segment is None:
+            print(f"{code}\t(no mapping)")
+        else:
+            print(f"{code}\t{segment}\t{subcategory}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='bb_initiatives', description="Buy & Build initiatives analysis.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for command, (_, help_text) in PIPELINES.items():
+        # -h/--help and all other options go to the pipeline's own parser
+        subparsers.add_parser(command, help=help_text, add_help=False)
+
+    classify_parser = subparsers.add_parser(
+        'classify-text', help="Segment and subcategory of company descriptions."
+    )
+    classify_parser.add_argument('texts', nargs='+', metavar='TEXT', help="Company description(s).")
+    classify_parser.add_argument('--keywords', default=None, help="Keywords of the company (default: none).")
+    classify_parser.add_argument('--rules', choices=('overview', 'targets'), default='overview',
+                                 help="Classify as the B&B overview does (substring matches, default) "
+                                      "or as the target mapping does (whole words, Norwegian keywords).")
+    classify_parser.set_defaults(run=classify_text)
+
+    batch_parser = subparsers.add_parser(
+        'classify-batch', help="Segment and subcategory of CSV/JSON Lines records, streamed in batches."
+    )
+    batch_parser.add_argument('input', nargs='?', default='-', help="Input file (default: stdin).")
+    batch_parser.add_argument('--format', choices=('csv', 'jsonl'), default='csv', help="Input format (default: csv).")
+    batch_parser.add_argument('--output-format', choices=('csv', 'jsonl'), default=None,
+                              help="Output format (default: the input format).")
+    batch_parser.add_argument('--id-field', default='Company ID', help="Field identifying a record (default: %(default)s; "
+                                                                       "records without it are numbered from 0).")
+    batch_parser.add_argument('--keywords-field', default='Keywords', help="Default: %(default)s.")
+    batch_parser.add_argument('--description-field', default='Description', help="Default: %(default)s.")
+    batch_parser.add_argument('--rules', choices=('overview', 'targets'), default='overview',
+                              help="Classification rules, as for classify-text (default: overview).")
+    batch_parser.add_argument('--batch-size', type=int, default=5000, help="Records per batch (default: %(default)s).")
+    batch_parser.add_argument('--workers', type=int, default=1,
+                              help="Processes per batch; only batches of 20000 records or more are split (default: 1).")
+    batch_parser.set_defaults(run=classify_batch)
+
+    nace_parser = subparsers.add_parser('nace-lookup', help="Segment and subcategory of NACE codes.")
+    nace_parser.add_argument('codes', nargs='+', metavar='CODE', help="NACE code(s), e.g. 43.22 or '41.201 - Bygging'.")
+    nace_parser.set_defaults(run=nace_lookup)
+    return parser
+
+
+def main(argv=None):
+    args, pipeline_argv = build_parser().parse_known_args(argv)
+    if args.command in PIPELINES:
+        module = importlib.import_module(PIPELINES[args.command][0], __package__)
+        module.main(pipeline_argv)
+    elif pipeline_argv:
+        build_parser().error(f"unrecognized arguments: {' '.join(pipeline_argv)}")
+    else:
+        args.run(args)
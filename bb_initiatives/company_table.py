@@ -0,0 +1,88 @@
+# company_table.py
+
+import sys
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class CompanyRecord:
+    """One company of the B&B report.
+
+    Uses __slots__ (no per-instance dict). Short labels that repeat across
+    companies (subcategory, investment type, dates, years) are interned, so
+    equal values share one string object.
+    """
+
+    __slots__ = ('id', 'base_name', 'year', 'date', 'description', 'subcategory', 'revenue', 'ebitda',
+                 'investment_type')
+
+    def __init__(self, id, base_name, year, date, description, subcategory, revenue, ebitda, investment_type):
+        self.id = id
+        self.base_name = base_name
+        self.year = year  # int, or 'Unknown'
+        self.date = _intern(date)
+        self.description = description
+        self.subcategory = _intern(subcategory)
+        self.revenue = _intern(revenue)
+        self.ebitda = _intern(ebitda)
+        self.investment_type = _intern(investment_type)
+
+
+class CompanyTable:
+    """All companies of the report, stored once each.
+
+    Groupings (segment/investor listings) hold integer positions into this
+    table instead of copies of the company data; `positions` maps a company key
+    (see initiatives.company_keys) to its position, and `keys` holds the key of
+    each position.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.keys = []
+        self.positions = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, position):
+        return self.records[position]
+
+    def add(self, key, record):
+        """Adds a company; a later row with the same key replaces the earlier one."""
+        position = self.positions.get(key)
+        if position is None:
+            self.positions[key] = len(self.records)
+            self.records.append(record)
+            self.keys.append(key)
+        else:
+            self.records[position] = record
+
+    def lookup(self, keys):
+        """Positions (int32 array) of a Series of company keys."""
+        return keys.map(self.positions).to_numpy(dtype='int32')
+
+    @classmethod
+    def from_frame(cls, df, key_col, year_col, date_col, revenue_col, ebitda_col,
+                   name_col='Companies', id_col='Company ID', description_col='Description',
+                   subcategory_col='Subcategory', investment_type_col='investment_type'):
+        """Builds the table from the classified platforms frame (rows without a company name are skipped)."""
+        df = df[df[name_col].notna()]
+        columns = (
+            df[key_col].tolist(),
+            df[id_col].tolist(),
+            df[name_col].tolist(),
+            df[year_col].astype(object).where(df[year_col].notna(), 'Unknown').tolist(),
+            df[date_col].where(df[date_col].notna(), 'Unknown').tolist(),
+            df[description_col].where(df[description_col].notna(), '').astype(str).tolist(),
+            df[subcategory_col].tolist(),
+            df[revenue_col].tolist(),
+            df[ebitda_col].tolist(),
+            df[investment_type_col].tolist(),
+        )
+        table = cls()
+        for key, *fields in zip(*columns):
+            table.add(key, CompanyRecord(*fields))
+        return table
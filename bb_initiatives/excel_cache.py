@@ -0,0 +1,244 @@
+# excel_cache.py
+
+import hashlib
+import json
+import os
+
+import openpyxl
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # Sidecars are optional; without pyarrow every run parses the workbook
+    pa = None
+
+# Sidecars are written to this folder next to the workbook
+SIDECAR_DIR = '.excel_cache'
+
+# Schema metadata describing the workbook a sidecar was built from
+_META_SIZE = b'source_size'
+_META_MTIME = b'source_mtime_ns'
+_META_SHA256 = b'source_sha256'
+# ... and how it was read: the sidecar format and the projected columns
+_META_FORMAT = b'sidecar_format'
+_META_COLUMNS = b'columns'
+
+# Bump when the stored frames change (this module, or a loader such as PlatformsReader), so
+# existing sidecars are rebuilt instead of serving frames in the old layout
+SIDECAR_FORMAT_VERSION = 3
+
+# Cell texts read as missing, as pd.read_excel does by default
+NA_STRINGS = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+})
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _text_cells(values):
+    # Every present cell as its text; missing cells stay missing
+    return values.astype(object).where(values.isna(), values.astype(str))
+
+
+def _arrow_table(df):
+    """The frame as an Arrow table; object columns Arrow can't store as one type (e.g. datetimes
+    mixed with text, or numbers with 'x') are stored as text."""
+    try:
+        return pa.Table.from_pandas(df, preserve_index=True)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        pass
+    df = df.copy(deep=False)
+    for col in df.columns[df.dtypes == object]:
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            df[col] = _text_cells(df[col])
+    return pa.Table.from_pandas(df, preserve_index=True)
+
+
+def _read_clean(path, sheet_name, header, dropna, engine):
+    """Reads a sheet the way the scripts always have, including the empty row/column cleanup."""
+    df = pd.read_excel(path, header=header, engine=engine, sheet_name=sheet_name)
+    if dropna:
+        df = df.dropna(how='all').dropna(axis=1, how='all')
+    return df
+
+
+class ExcelSidecar:
+    """One sheet of an Excel workbook, cached as an Arrow IPC sidecar file.
+
+    The first read parses the workbook with openpyxl (including the header row
+    offset and, with `dropna=True`, the removal of empty rows and columns) and
+    stores the result next to it in SIDECAR_DIR. Later reads memory-map the
+    sidecar as long as the workbook's size and mtime match; if they don't, the
+    content hash decides whether the workbook really changed.
+
+    Columns mixing types Arrow can't store together (e.g. datetimes and text)
+    are stored, and read, as text. Without pyarrow, or for sheets with
+    non-string headers, reads go straight to the workbook as before.
+
+    `loader` replaces the pd.read_excel parse with a custom one (e.g. a streaming,
+    column-projected reader); `variant` names its sidecar so it never collides
+    with the full-sheet one, and `columns` lists the columns the loader projects.
+    A sidecar is only used if it was written with the same columns and
+    SIDECAR_FORMAT_VERSION.
+    """
+
+    def __init__(self, path, sheet_name=0, header=0, dropna=True, engine='openpyxl', loader=None, variant=None,
+                 columns=None):
+        self.path = path
+        self.sheet_name = sheet_name
+        self.header = header
+        self.dropna = dropna
+        self.engine = engine
+        self.loader = loader
+        self.projection = None if columns is None else list(columns)
+        directory, filename = os.path.split(path)
+        suffix = f"{sheet_name}.h{header}{'.clean' if dropna else ''}{f'.{variant}' if variant else ''}.arrow"
+        self.sidecar_path = os.path.join(directory, SIDECAR_DIR, f"{filename}.{suffix}")
+        self._table = None
+        self._uncached = None  # DataFrame read directly when no sidecar can be used
+
+    def _format_metadata(self):
+        return {_META_FORMAT: str(SIDECAR_FORMAT_VERSION).encode(),
+                _META_COLUMNS: json.dumps(self.projection).encode()}
+
+    def _source_metadata(self):
+        stat = os.stat(self.path)
+        return {_META_SIZE: str(stat.st_size).encode(), _META_MTIME: str(stat.st_mtime_ns).encode()}
+
+    def _open_sidecar(self, source_metadata):
+        """Memory-maps a valid existing sidecar, or returns None."""
+        if not os.path.exists(self.sidecar_path):
+            return None
+        try:
+            table = pa.ipc.open_file(pa.memory_map(self.sidecar_path)).read_all()
+        except (OSError, pa.ArrowInvalid):
+            return None
+        metadata = table.schema.metadata or {}
+        # Written by another version of the readers, or with other columns: rebuild
+        if any(metadata.get(key) != value for key, value in self._format_metadata().items()):
+            return None
+        if all(metadata.get(key) == value for key, value in source_metadata.items()):
+            return table
+        # Size or mtime changed: the workbook may only have been touched or copied
+        if metadata.get(_META_SHA256) == _file_sha256(self.path).encode():
+            try:
+                self._write_sidecar(table, source_metadata)
+            except OSError:
+                pass  # Still valid; the hash is simply checked again next run
+            return table
+        return None
+
+    def _write_sidecar(self, table, source_metadata):
+        metadata = dict(table.schema.metadata or {})
+        metadata.update(source_metadata)
+        metadata.update(self._format_metadata())
+        if _META_SHA256 not in source_metadata:
+            metadata[_META_SHA256] = _file_sha256(self.path).encode()
+        table = table.replace_schema_metadata(metadata)
+        os.makedirs(os.path.dirname(self.sidecar_path), exist_ok=True)
+        # Write to a temporary file first so a crashed run never leaves a half-written sidecar
+        tmp_path = f"{self.sidecar_path}.tmp"
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, self.sidecar_path)
+
+    def _parse(self):
+        if self.loader is not None:
+            return self.loader()
+        return _read_clean(self.path, self.sheet_name, self.header, self.dropna, self.engine)
+
+    def _load(self):
+        if self._table is not None or self._uncached is not None:
+            return
+        if pa is None:
+            self._uncached = self._parse()
+            return
+        source_metadata = self._source_metadata()
+        self._table = self._open_sidecar(source_metadata)
+        if self._table is not None:
+            return
+
+        df = self._parse()
+        try:
+            if not all(isinstance(col, str) for col in df.columns):
+                raise TypeError("non-string column headers")
+            table = _arrow_table(df)
+        except (TypeError, pa.ArrowException) as e:
+            print(f"Warning: Could not cache '{self.path}' ({self.sheet_name}) as Arrow: {e}")
+            self._uncached = df
+            return
+        try:
+            self._write_sidecar(table, source_metadata)
+        except OSError as e:
+            print(f"Warning: Could not write the Arrow cache of '{self.path}' ({self.sheet_name}): {e}")
+        # Read from the table even on this first run, so every run sees the same (stored) frame
+        self._table = table
+
+    def columns(self):
+        """Column headers of the (cleaned) sheet."""
+        self._load()
+        if self._uncached is not None:
+            return list(self._uncached.columns)
+        index_columns = self._table.schema.pandas_metadata.get('index_columns', [])
+        return [name for name in self._table.column_names if name not in index_columns]
+
+    def read(self, columns=None):
+        """The sheet as a DataFrame, optionally only the given columns (in that order)."""
+        self._load()
+        if self._uncached is not None:
+            return self._uncached if columns is None else self._uncached[list(columns)]
+        table = self._table
+        if columns is not None:
+            index_columns = [c for c in table.schema.pandas_metadata.get('index_columns', []) if isinstance(c, str)]
+            table = table.select(list(columns) + index_columns)
+        return table.to_pandas()
+
+
+def is_missing_cell(value):
+    """True for empty cells and the texts pd.read_excel treats as missing."""
+    return value is None or (isinstance(value, str) and value in NA_STRINGS)
+
+
+def iter_sheet_rows(path, sheet_name, header_row, select_columns):
+    """Streams the selected cells of each non-blank row below a header row.
+
+    The sheet is read with openpyxl's read-only mode, one row at a time.
+    `select_columns` is called once with the header names (strings, '' for empty
+    header cells) and returns the 0-based positions to keep, in the order they
+    should appear in each yielded list. Missing cells come out as None, and rows
+    where every selected cell is missing are skipped.
+    """
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name]
+        header = next(sheet.iter_rows(min_row=header_row, max_row=header_row, values_only=True), ())
+        positions = list(select_columns(['' if value is None else str(value) for value in header]))
+        if not positions:
+            return
+        # Only the span of selected columns is materialized for each row
+        first, last = min(positions), max(positions)
+        offsets = [position - first for position in positions]
+        width = last - first + 1
+        for values in sheet.iter_rows(min_row=header_row + 1, min_col=first + 1, max_col=last + 1, values_only=True):
+            if len(values) < width:
+                values = tuple(values) + (None,) * (width - len(values))
+            row = [None if is_missing_cell(values[offset]) else values[offset] for offset in offsets]
+            if any(value is not None for value in row):
+                yield row
+    finally:
+        workbook.close()
+
+
+def read_excel_cached(path, sheet_name=0, header=0, dropna=True, engine='openpyxl'):
+    """pd.read_excel (plus the empty row/column cleanup) served from an Arrow sidecar when possible."""
+    return ExcelSidecar(path, sheet_name=sheet_name, header=header, dropna=dropna, engine=engine).read()
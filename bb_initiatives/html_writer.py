@@ -0,0 +1,16 @@
+# html_writer.py
+#
+# Output of the HTML reports. Renderers yield the page as fragments (generators); write_fragments
+# writes them through one buffered file as they come, so no report is ever held as one string.
+
+# Bytes buffered before each write to disk
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def write_fragments(path, fragments, buffer_size=WRITE_BUFFER_SIZE):
+    """Writes each fragment of `fragments` to `path` (UTF-8); returns the number of characters written."""
+    written = 0
+    with open(path, 'w', encoding='utf-8', buffering=buffer_size) as f:
+        for fragment in fragments:
+            written += f.write(fragment)
+    return written
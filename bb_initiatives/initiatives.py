@@ -0,0 +1,58 @@
+# initiatives.py
+
+import pandas as pd
+
+from .investment_types import explode_investors
+from .investors import InvestorDimension
+
+
+def company_keys(df, id_col='Company ID', name_col='Companies'):
+    """Identity of each company row: its Company ID, or its name when the ID is missing."""
+    return df[id_col].where(df[id_col].notna(), df[name_col]).rename('Company key')
+
+
+def company_labels(df, name_col='Companies', year_col=None):
+    """Company names with the financing year appended when known, e.g. 'Assemblin (2021)'."""
+    names = df[name_col]
+    if year_col is None:
+        return names
+    years = df[year_col]
+    return names.where(years.isna(), names + ' (' + years.astype(str) + ')')
+
+
+def build_initiatives(df, investors=None, name_col='Companies', year_col=None, investors_col='All investors',
+                      id_col='Company ID'):
+    """One row per (company, investor): Investor (categorical), Segment, the company's label and its key.
+
+    Investors are split on ',' and normalized through `investors` (the run's
+    InvestorDimension); rows without investors or without a company name are
+    left out. Rows keep the company order of `df`, and the investor order within
+    each company.
+    """
+    companies = df[df[name_col].notna()]
+    if investors is None:
+        investors = InvestorDimension.build(companies[investors_col])
+    pairs = explode_investors(companies, investors, investors_col)
+    # Categorical over the dimension's names: its codes are the investor codes
+    pairs.insert(0, 'Investor', pd.Categorical.from_codes(pairs.pop('Investor code'), categories=investors.names))
+    pairs['Company'] = company_labels(companies, name_col, year_col).reindex(pairs.index)
+    pairs['Company key'] = company_keys(companies, id_col, name_col).reindex(pairs.index)
+    return pairs.reset_index(drop=True)
+
+
+def summarize_initiatives(df_initiatives):
+    """Companies per (Investor, Segment), sorted by investor and then by number of companies (descending).
+
+    Groups on the categorical Investor (its codes follow the names' alphabetical
+    order) and Segment.
+
+    'Companies' is the comma-joined label list shown in the Excel overview; code
+    that needs the companies themselves should group df_initiatives by 'Company key'.
+    """
+    df_summary = (
+        df_initiatives.groupby(['Investor', 'Segment'], observed=True)['Company']
+        .agg(**{'Number of Companies': 'size', 'Companies': ', '.join})
+        .reset_index()
+    )
+    # Stable multi-key sort: equal counts keep the (Investor, Segment) order of the groupby
+    return df_summary.sort_values(['Investor', 'Number of Companies'], ascending=[True, False])
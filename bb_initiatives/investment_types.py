@@ -0,0 +1,102 @@
+# investment_types.py
+
+import numpy as np
+import pandas as pd
+
+from .investors import InvestorDimension, split_investors
+
+PLATFORM = 'Platform'
+ADD_ON = 'Add-on'
+UNKNOWN = 'Unknown'
+
+# A company with more than this multiple of its segment's average revenue is a platform
+LARGE_COMPANY_REVENUE_FACTOR = 5
+
+# Categories of the investment_type column, in the order of their ordinal codes,
+# so a company's status is the max over its rows
+INVESTMENT_TYPES = [UNKNOWN, ADD_ON, PLATFORM]
+_STATUS_CODES = {status: code for code, status in enumerate(INVESTMENT_TYPES)}
+
+
+def explode_investors(df, investors=None, investors_col='All investors'):
+    """One row per (company row, investor), in row order, with the investor's code in
+    `investors` (an InvestorDimension, built from df if not given); the index points back to df."""
+    names = split_investors(df[investors_col])
+    if investors is None:
+        investors = InvestorDimension(names)
+    return pd.DataFrame({'Investor code': investors.encode(names), 'Segment': df['Segment'].reindex(names.index)})
+
+
+def classify_investments(df, dates, revenue=None, investors=None,
+                         id_col='Company ID', name_col='Companies', investors_col='All investors'):
+    """Platform/Add-on/Unknown `investment_type` for each company row, using parsed financing `dates`.
+
+    - Every company with a financing date is an add-on by default.
+    - The earliest dated company of each (Investor, Segment) is a platform
+      (ties go to the first of the companies in row order).
+    - A company whose numeric `revenue` is more than 5x its segment's average
+      revenue is a platform, even if it has no date.
+    - Rows of the same company (Company ID + name) share the highest status.
+
+    Investors are matched by their code in `investors` (the run's InvestorDimension).
+
+    Returns (investment_type Series aligned to df, number of companies per status).
+    """
+    codes = pd.Series(np.where(dates.notna(), _STATUS_CODES[ADD_ON], _STATUS_CODES[UNKNOWN]), index=df.index)
+
+    # Dated companies, earliest first; the stable sort keeps companies with equal dates in row order
+    dated = df.loc[dates.dropna().sort_values(kind='stable').index]
+    pairs = explode_investors(dated, investors, investors_col)
+    pairs['date'] = dates.reindex(pairs.index)
+    # idxmin keeps the first of equal dates in sorted order, like a strict "earlier than" scan
+    first_rows = pairs.reset_index().groupby(['Investor code', 'Segment'], sort=False)['date'].idxmin()
+    platform_rows = pairs.index[first_rows.to_numpy()]
+    codes.loc[platform_rows] = _STATUS_CODES[PLATFORM]
+
+    if revenue is not None:
+        segment_avg_revenue = revenue.groupby(df['Segment']).transform('mean')
+        codes[revenue > segment_avg_revenue * LARGE_COMPANY_REVENUE_FACTOR] = _STATUS_CODES[PLATFORM]
+
+    return _per_company(df, codes, id_col, name_col, 'max')
+
+
+def classify_investments_without_dates(df, investors=None,
+                                       id_col='Company ID', name_col='Companies', investors_col='All investors'):
+    """Fallback `investment_type` when there is no financing date column.
+
+    Each investor's first company (in row order) in a segment is a platform, the
+    others are add-ons. A company listed under several investors keeps the status
+    from its last listing in the report's order: segments by first appearance,
+    then investors alphabetically.
+    """
+    pairs = explode_investors(df, investors, investors_col)
+    pairs['code'] = np.where(pairs.duplicated(['Investor code', 'Segment']), _STATUS_CODES[ADD_ON], _STATUS_CODES[PLATFORM])
+    pairs['segment_order'] = pd.Series(pd.factorize(df['Segment'])[0], index=df.index).reindex(pairs.index)
+    pairs[[id_col, name_col]] = df[[id_col, name_col]].reindex(pairs.index)
+
+    # The original script wrote each company's status while walking the report (segments, then
+    # investors alphabetically; investor codes are in that order), so its last listing wins. That
+    # one reduction already gives every row of a company the same status
+    listed = pairs.sort_values(['segment_order', 'Investor code'], kind='stable')
+    company_codes = listed.groupby([id_col, name_col], dropna=False, sort=False)['code'].last().rename('_code')
+    codes = df[[id_col, name_col]].merge(company_codes.reset_index(), on=[id_col, name_col], how='left')['_code']
+    return _labeled(df, codes.fillna(_STATUS_CODES[UNKNOWN]).to_numpy(), id_col, name_col)
+
+
+def _per_company(df, codes, id_col, name_col, how):
+    """Gives all rows of a company (Company ID + name) one status, then labels and counts them."""
+    companies = df[[id_col, name_col]].assign(_code=codes)
+    codes = companies.groupby([id_col, name_col], dropna=False, sort=False)['_code'].transform(how)
+    return _labeled(df, codes.to_numpy(), id_col, name_col)
+
+
+def _labeled(df, codes, id_col, name_col):
+    """investment_type Series of per-row status codes (equal for all rows of a company), and the counts."""
+    investment_type = pd.Series(
+        pd.Categorical.from_codes(codes.astype('int8'), categories=INVESTMENT_TYPES),
+        index=df.index, name='investment_type'
+    )
+
+    per_company = df[[id_col, name_col]].assign(investment_type=investment_type).drop_duplicates([id_col, name_col])
+    counts = per_company['investment_type'].value_counts()
+    return investment_type, {status: int(counts.get(status, 0)) for status in (PLATFORM, ADD_ON)}
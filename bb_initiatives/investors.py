@@ -0,0 +1,141 @@
+# investors.py
+
+import json
+import os
+
+import pandas as pd
+
+from .excel_cache import read_excel_cached
+
+INVESTORS_FILE = 'B&B investors.xlsx'
+INVESTORS_HEADER_ROW = 6
+INVESTOR_NAME_COLUMN = 'Investors'
+
+# Alternative spellings -> the name to report them under. Extended (or overridden) by
+# INVESTOR_ALIASES_FILE, a JSON object like {"EQT Partners": "EQT"}, when it exists
+INVESTOR_ALIASES = {}
+INVESTOR_ALIASES_FILE = 'investor_aliases.json'
+
+
+# Whitespace, spelled out: Arrow-backed string columns don't count non-breaking spaces as \s
+_WHITESPACE_PATTERN = '[\\s\u00a0\u2007\u202f]+'
+
+
+def normalize_investor_names(names):
+    """Strips and collapses whitespace (including non-breaking spaces) on a Series of names."""
+    return names.astype(str).str.replace(_WHITESPACE_PATTERN, ' ', regex=True).str.strip()
+
+
+def investor_key(name):
+    """Matching key of a normalized name: spellings differing only in case are one investor."""
+    return name.casefold()
+
+
+def split_investors(values, separator=','):
+    """One normalized investor name per (row, investor) of an 'All investors' column;
+    the index points back to the rows. Blank entries are dropped."""
+    names = normalize_investor_names(values.dropna().astype(str).str.split(separator).explode())
+    return names[names != '']
+
+
+def load_investor_aliases(path=INVESTOR_ALIASES_FILE):
+    """INVESTOR_ALIASES updated with the aliases in `path` (if the file exists)."""
+    aliases = dict(INVESTOR_ALIASES)
+    if path and os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            aliases.update(json.load(f))
+    return aliases
+
+
+def read_investors(path=INVESTORS_FILE, header=INVESTORS_HEADER_ROW):
+    """The B&B investors sheet, or None if the workbook is missing."""
+    if not os.path.exists(path):
+        return None
+    return read_excel_cached(path, header=header)
+
+
+def _resolve_alias_chains(alias_keys):
+    """Alias key -> final name: chained aliases (A -> B, B -> C) are followed to the end (C).
+
+    Raises ValueError on a cycle (A -> B, B -> A); an alias of itself (e.g. a
+    change of case) is not one.
+    """
+    resolved = {}
+    for key, canonical in alias_keys.items():
+        seen = [key]
+        target_key = investor_key(canonical)
+        while target_key in alias_keys and target_key != seen[-1]:
+            if target_key in seen:
+                raise ValueError(f"Investor aliases form a cycle through {canonical!r}")
+            seen.append(target_key)
+            canonical = alias_keys[target_key]
+            target_key = investor_key(canonical)
+        resolved[key] = canonical
+    return resolved
+
+
+class InvestorDimension:
+    """Every investor of a run, once, with an integer code.
+
+    Names are normalized (whitespace) and matched case-insensitively, and aliases
+    are resolved (through chains of aliases), so "EQT", "EQT " and an aliased
+    "EQT Partners" share one code.
+    Codes follow the alphabetical order of the reported names, so sorting or
+    grouping by code gives the same order as sorting by name.
+
+    `table` is indexed by code and holds the reported name plus the columns of
+    the B&B investors sheet, joined on the (aliased) name; `matched` counts the
+    investors of `names` found in the sheet.
+    """
+
+    def __init__(self, names, reference=None, aliases=None, reference_name_col=INVESTOR_NAME_COLUMN):
+        aliases = aliases or {}
+        self._alias_keys = _resolve_alias_chains({
+            investor_key(alias): canonical
+            for alias, canonical in zip(normalize_investor_names(pd.Series(list(aliases), dtype=object)),
+                                        normalize_investor_names(pd.Series(list(aliases.values()), dtype=object)))
+        })
+        # Reported spelling per key: the alias target, else the investors sheet's spelling, else the first seen
+        spellings = {investor_key(canonical): canonical for canonical in self._alias_keys.values()}
+        reference_names = None
+        if reference is not None and reference_name_col in reference.columns:
+            reference_names = normalize_investor_names(reference[reference_name_col].dropna())
+        for name in pd.unique(pd.concat([s for s in (reference_names, names) if s is not None])):
+            spellings.setdefault(self._canonical_key(name), name)
+
+        self.names = pd.Index(sorted(spellings.values()), name='Investor')
+        self._codes = {investor_key(name): code for code, name in enumerate(self.names)}
+        self.table = self.names.to_frame(index=False)
+        self.table.index.name = 'Investor code'
+
+        self.matched = 0
+        if reference_names is not None:
+            details = reference.loc[reference_names.index].drop(columns=reference_name_col)
+            details.index = pd.Index(reference_names.map(self.code).to_numpy(), name='Investor code')
+            details = details[~details.index.duplicated()]
+            self.table = self.table.join(details)
+            # Investors of the run (not only of the sheet) that the sheet describes
+            self.matched = int(details.index.isin(pd.unique(names.map(self.code))).sum())
+
+    def __len__(self):
+        return len(self.names)
+
+    def _canonical_key(self, name):
+        key = investor_key(name)
+        canonical = self._alias_keys.get(key)
+        return key if canonical is None else investor_key(canonical)
+
+    def code(self, name):
+        """Code of one normalized name (-1 if unknown)."""
+        return self._codes.get(self._canonical_key(name), -1)
+
+    def encode(self, names):
+        """int32 codes for a Series of normalized names, with one lookup per distinct spelling."""
+        distinct = pd.Series(pd.unique(names))
+        codes = dict(zip(distinct, distinct.map(self.code)))
+        return names.map(codes).astype('int32')
+
+    @classmethod
+    def build(cls, investor_lists, reference=None, aliases=None, separator=','):
+        """Dimension of the investors named in an 'All investors' column (plus those of `reference`)."""
+        return cls(split_investors(investor_lists, separator), reference=reference, aliases=aliases)
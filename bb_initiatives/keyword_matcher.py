@@ -0,0 +1,345 @@
+# keyword_matcher.py
+
+import hashlib
+import json
+import os
+import re
+
+# Parallel classification: below PARALLEL_MIN_ROWS the cost of starting worker
+# processes outweighs the gain, so classification stays serial
+PARALLEL_MIN_ROWS = 20000
+PARALLEL_CHUNK_ROWS = 5000
+
+# Trie key marking the end of a keyword (never equal to a single text character)
+_END = ''
+
+
+def _is_word_char(ch):
+    # Same definition of a word character as the regex \b used for matching
+    return ch.isalnum() or ch == '_'
+
+
+def _trie_pattern(node, word_boundary):
+    """Builds a regex matching the longest keyword along the paths of a trie node."""
+    branches = [re.escape(ch) + _trie_pattern(child, word_boundary)
+                for ch, child in sorted(node.items()) if ch != _END]
+    # With word boundaries a keyword only ends where \b holds, otherwise the regex backtracks
+    stop = r'\b' if word_boundary else ''
+    if not branches:
+        return stop
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if _END in node:
+        # Prefer the longer keyword, fall back to the one ending here
+        return f'(?:{body}|{stop})' if word_boundary else f'(?:{body})?'
+    return body
+
+
+class KeywordMatcher:
+    """Compiled multi-keyword matcher built once from an ordered taxonomy.
+
+    `groups` maps a label (segment or subcategory) to its keywords. All keywords
+    are merged into one trie and compiled into a single regex that matches the
+    longest keyword at a position; the regex engine skips to each position where a
+    keyword starts, and keywords that are prefixes of the matched one are resolved
+    from a precomputed table. The cost per text therefore depends on the text and
+    the number of matches, not on the number of keywords.
+
+    With `word_boundary=False` a keyword matches anywhere in the text (the
+    `keyword in text` test of segment_classification.py). With `word_boundary=True`
+    it has to match as r'\\bkeyword\\b' (the re.search test of map_targets_to_bb.py).
+    Texts are expected to be lowercased already; keywords are lowercased here.
+    """
+
+    def __init__(self, groups, word_boundary=False):
+        self.labels = list(groups)
+        self.word_boundary = word_boundary
+        self.max_keyword_length = 0
+        keyword_groups = {}
+        for index, label in enumerate(self.labels):
+            for keyword in groups[label]:
+                keyword = keyword.lower()
+                if keyword:
+                    keyword_groups.setdefault(keyword, []).append(index)
+                    self.max_keyword_length = max(self.max_keyword_length, len(keyword))
+
+        trie = {}
+        for keyword in keyword_groups:
+            node = trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[_END] = True
+
+        # Per keyword: (length, group indices) of itself and every keyword that is a prefix of it,
+        # longest first, since all of them start wherever the regex matches the keyword
+        self._matches = {}
+        for keyword in keyword_groups:
+            self._matches[keyword] = [
+                (length, keyword_groups[keyword[:length]])
+                for length in range(len(keyword), 0, -1)
+                if keyword[:length] in keyword_groups
+            ]
+        self._pattern = re.compile(_trie_pattern(trie, word_boundary)) if trie else None
+
+    def finditer(self, text):
+        """Yields (group_index, start, end) for every keyword occurrence, overlaps included."""
+        if self._pattern is None or not text:
+            return
+        search = self._pattern.search
+        word_boundary = self.word_boundary
+        length = len(text)
+        match = search(text)
+        while match is not None:
+            start = match.start()
+            if word_boundary:
+                # \b before the keyword: previous character vs. its first character
+                start_ok = (start == 0 or not _is_word_char(text[start - 1])) == _is_word_char(text[start])
+            if not word_boundary or start_ok:
+                for keyword_length, group_indices in self._matches[match.group()]:
+                    end = start + keyword_length
+                    if word_boundary:
+                        # The regex checked \b after the longest keyword only
+                        next_is_word = end < length and _is_word_char(text[end])
+                        if next_is_word == _is_word_char(text[end - 1]):
+                            continue
+                    for group_index in group_indices:
+                        yield group_index, start, end
+            # Keywords may overlap, so the next search starts one character further
+            match = search(text, start + 1)
+
+    def matched_groups(self, text):
+        """Returns the set of group indices with at least one keyword in the text."""
+        return {group_index for group_index, _, _ in self.finditer(text)}
+
+    def first_match(self, text, default=None):
+        """Returns the first label (in taxonomy order) with a keyword in the text."""
+        matched = self.matched_groups(text)
+        if not matched:
+            return default
+        return self.labels[min(matched)]
+
+    def junction_groups(self, left, right):
+        """Returns the group indices of keywords spanning the space in f"{left} {right}".
+
+        Only a window of the longest keyword length on each side is scanned, which is
+        enough context for any keyword (and its word boundaries) crossing the join.
+        """
+        width = self.max_keyword_length
+        if width == 0:
+            return set()
+        left = left[-width:]
+        window = f"{left} {right[:width]}"
+        join = len(left)
+        return {group_index for group_index, start, end in self.finditer(window) if start <= join < end}
+
+
+# Compiled matchers keyed by the identity of the taxonomy dict they were built from.
+# The dict itself is kept alongside so its id cannot be reused while cached.
+_compiled_matchers = {}
+
+
+def compiled_matcher(groups, word_boundary=False):
+    """Returns the KeywordMatcher for a taxonomy dict, compiling it on first use."""
+    key = (id(groups), word_boundary)
+    cached = _compiled_matchers.get(key)
+    if cached is None or cached[0] is not groups:
+        cached = (groups, KeywordMatcher(groups, word_boundary=word_boundary))
+        _compiled_matchers[key] = cached
+    return cached[1]
+
+
+class TaxonomyClassifier:
+    """Single-pass (Segment, Subcategory) classifier over one compiled taxonomy.
+
+    Segment and subcategory keywords share one KeywordMatcher. The keywords and
+    description of a company are lowercased once and each is scanned once; only
+    the few characters around the joining space are scanned again for the text
+    each step sees, so the result is identical to running find_matching_segment
+    and identify_subcategory one after the other.
+
+    - `default_subcategory(segment)` gives the subcategory when none matches
+      (and for segments without subcategory definitions, e.g. 'Other').
+    - `skip_subcategories` are never matched on keywords ('General' in the targets script).
+    - `subcategory_text='same'` matches subcategories on the segment text
+      "keywords description"; `'description_first'` matches them on
+      "description keywords" with missing fields left empty, as the B&B overview does.
+    """
+
+    def __init__(self, segments_data, subcategory_keywords, word_boundary=False,
+                 default_segment='Other', default_subcategory=None, skip_subcategories=(),
+                 subcategory_text='same'):
+        if subcategory_text not in ('same', 'description_first'):
+            raise ValueError(f"Unknown subcategory_text '{subcategory_text}'")
+        # Constructor arguments, so worker processes can build their own copy
+        self.config = dict(
+            segments_data=segments_data, subcategory_keywords=subcategory_keywords,
+            word_boundary=word_boundary, default_segment=default_segment,
+            default_subcategory=default_subcategory, skip_subcategories=tuple(skip_subcategories),
+            subcategory_text=subcategory_text,
+        )
+        self.default_segment = default_segment
+        self.default_subcategory = default_subcategory or _general_subcategory
+        self.subcategory_text = subcategory_text
+
+        groups = {}
+        for segment, keywords in segments_data.items():
+            groups[('segment', segment)] = keywords
+        for segment, subcategories in subcategory_keywords.items():
+            for subcategory, keywords in subcategories.items():
+                if subcategory not in skip_subcategories:
+                    groups[('subcategory', segment, subcategory)] = keywords
+        self.matcher = KeywordMatcher(groups, word_boundary=word_boundary)
+
+        # Segment group indices are 0..len(segments_data)-1, in dictionary order
+        self._segments = list(segments_data)
+        # Per segment: its subcategory group indices in dictionary order
+        self._subcategory_groups = {}
+        for group_index, label in enumerate(self.matcher.labels):
+            if label[0] == 'subcategory':
+                self._subcategory_groups.setdefault(label[1], []).append((group_index, label[2]))
+
+        # Every label the classifier can return (sorted), e.g. for fixed categorical category sets
+        self.segment_labels = sorted({*segments_data, default_segment})
+        self.subcategory_labels = sorted({
+            *(label[2] for label in self.matcher.labels if label[0] == 'subcategory'),
+            *(self.default_subcategory(segment) for segment in [*segments_data, default_segment]),
+        })
+
+        # Fingerprints for the classification cache: the segment rules decide every row, while
+        # the subcategory rules (keywords and default) of a segment only decide rows in that segment
+        self.segments_fingerprint = _fingerprint(
+            [word_boundary, subcategory_text, default_segment, list(segments_data.items())]
+        )
+        self.subcategory_fingerprints = {
+            segment: _fingerprint([
+                [[name, keywords] for name, keywords in subcategory_keywords.get(segment, {}).items()
+                 if name not in skip_subcategories],
+                self.default_subcategory(segment),
+            ])
+            for segment in [*segments_data, default_segment]
+        }
+
+    def _pick(self, segment_matches, subcategory_matches):
+        segment_indices = [i for i in segment_matches if i < len(self._segments)]
+        segment = self._segments[min(segment_indices)] if segment_indices else self.default_segment
+        for group_index, subcategory in self._subcategory_groups.get(segment, ()):
+            if group_index in subcategory_matches:
+                return segment, subcategory
+        return segment, self.default_subcategory(segment)
+
+    def classify_texts(self, keywords_text, description_text, keywords_missing=False, description_missing=False):
+        """Classifies already lowercased texts; missing fields are rendered as 'nan' like str(NaN)."""
+        matcher = self.matcher
+        keyword_matches = matcher.matched_groups(keywords_text)
+        description_matches = matcher.matched_groups(description_text)
+        segment_matches = keyword_matches | description_matches | matcher.junction_groups(keywords_text, description_text)
+
+        if self.subcategory_text == 'same':
+            return self._pick(segment_matches, segment_matches)
+
+        # "description keywords" with missing fields left empty
+        sub_description = '' if description_missing else description_text
+        sub_keywords = '' if keywords_missing else keywords_text
+        subcategory_matches = matcher.junction_groups(sub_description, sub_keywords)
+        if not description_missing:
+            subcategory_matches |= description_matches
+        if not keywords_missing:
+            subcategory_matches |= keyword_matches
+        return self._pick(segment_matches, subcategory_matches)
+
+    def classify(self, keywords, description):
+        """Classifies one company from its raw Keywords and Description (None = missing)."""
+        keywords_missing = keywords is None
+        description_missing = description is None
+        keywords_text = 'nan' if keywords_missing else str(keywords).lower()
+        description_text = 'nan' if description_missing else str(description).lower()
+        return self.classify_texts(keywords_text, description_text, keywords_missing, description_missing)
+
+    def classify_rows(self, rows, workers=1):
+        """Classifies (keywords_text, description_text, keywords_missing, description_missing) rows.
+
+        `workers` > 1 (or None for all cores) classifies large inputs in a process pool;
+        inputs smaller than PARALLEL_MIN_ROWS are always classified serially.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and len(rows) >= PARALLEL_MIN_ROWS:
+            results = _classify_parallel(self, rows, workers)
+        else:
+            results = [self.classify_texts(*row) for row in rows]
+        if not results:
+            return [], []
+        segments, subcategories = zip(*results)
+        return list(segments), list(subcategories)
+
+    def classify_frame(self, df, keywords_col='Keywords', description_col='Description', cache=None, workers=1):
+        """Classifies every row of a DataFrame; returns (segments, subcategories) lists in row order.
+
+        With a ClassificationCache only rows whose text (or taxonomy) changed are classified.
+        """
+        rows = frame_rows(df, keywords_col, description_col)
+        if cache is not None:
+            return cache.classify_rows(self, rows, workers=workers)
+        return self.classify_rows(rows, workers=workers)
+
+
+# Classifier of the current worker process, built once by _init_worker
+_worker_classifier = None
+
+
+def _init_worker(config):
+    global _worker_classifier
+    _worker_classifier = TaxonomyClassifier(**config)
+
+
+def _classify_chunk(rows):
+    return [_worker_classifier.classify_texts(*row) for row in rows]
+
+
+def _classify_parallel(classifier, rows, workers):
+    """Classifies rows in chunks across a process pool; results come back in input order."""
+    # Imported here: only large parallel runs need them, and importing the classifier stays cheap
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = [rows[i:i + PARALLEL_CHUNK_ROWS] for i in range(0, len(rows), PARALLEL_CHUNK_ROWS)]
+    # fork lets workers start without re-importing the calling script
+    start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_init_worker,
+        initargs=(classifier.config,),
+    ) as executor:
+        results = []
+        for chunk_results in executor.map(_classify_chunk, chunks):
+            results.extend(chunk_results)
+    return results
+
+
+def _general_subcategory(segment):
+    return 'General'
+
+
+def first_word_subcategory(segment):
+    """Default subcategory of the B&B overview: the first word of the segment name."""
+    return segment.split(' ')[0]
+
+
+def _fingerprint(value):
+    return hashlib.blake2b(json.dumps(value, ensure_ascii=False).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _normalized_column(df, column):
+    """Lowercased str() of every cell in a column plus its missing-value mask, as lists."""
+    if column not in df.columns:
+        return [''] * len(df), [False] * len(df)
+    values = df[column]
+    # map(str) keeps str(NaN) == 'nan' (astype(str) leaves missing values missing on newer pandas)
+    return values.map(str).str.lower().tolist(), values.isna().tolist()
+
+
+def frame_rows(df, keywords_col='Keywords', description_col='Description'):
+    """Normalized classifier input rows for a DataFrame, computed column-wise."""
+    keywords_text, keywords_missing = _normalized_column(df, keywords_col)
+    description_text, description_missing = _normalized_column(df, description_col)
+    return list(zip(keywords_text, description_text, keywords_missing, description_missing))
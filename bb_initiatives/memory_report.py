@@ -0,0 +1,62 @@
+# memory_report.py
+
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _size(size):
+    return f"{size / 2**20:.1f} MB" if size >= 2**20 else f"{size / 2**10:.1f} KB"
+
+
+def peak_rss():
+    """Peak resident memory of the process in bytes (None where unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class MemoryReport:
+    """Deep memory use (`memory_usage(deep=True)`) of the pipeline's DataFrames, per stage.
+
+    `record` prints one line per stage; `print_summary` repeats the stages and
+    breaks the last recorded version of each frame down by column. Nothing is
+    measured when disabled, so the calls can stay in the pipeline.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.stages = []
+        self._columns = {}
+
+    def record(self, stage, **frames):
+        if not self.enabled:
+            return
+        sizes = {name: int(df.memory_usage(deep=True).sum()) for name, df in frames.items()}
+        self.stages.append((stage, sizes, peak_rss()))
+        # Per-column breakdown now, so the report keeps no reference to the frames
+        for name, df in frames.items():
+            usage = df.memory_usage(deep=True, index=False).sort_values(ascending=False)
+            self._columns[name] = (len(df), [(column, str(df[column].dtype), size) for column, size in usage.items()])
+        print(f"[memory] {self._stage_line(*self.stages[-1])}")
+
+    @staticmethod
+    def _stage_line(stage, sizes, rss):
+        line = f"{stage}: " + ', '.join(f"{name} {_size(size)}" for name, size in sizes.items())
+        return line if rss is None else f"{line} (peak RSS {_size(rss)})"
+
+    def print_summary(self):
+        if not self.enabled:
+            return
+        print("\nMemory report (memory_usage(deep=True)):")
+        for stage in self.stages:
+            print(f"  {self._stage_line(*stage)}")
+        for name, (rows, columns) in self._columns.items():
+            print(f"\n  {name} ({rows} rows, {_size(sum(size for _, _, size in columns))}):")
+            for column, dtype, size in columns:
+                print(f"    {column:<30} {dtype:<16} {_size(size)}")
@@ -0,0 +1,90 @@
+# money.py
+
+import numpy as np
+import pandas as pd
+
+# Multipliers of the unit suffixes found after an amount ("850k", "12,5m", "€1.2bn", "3 mrd")
+UNIT_SCALES = {
+    'k': 1e3, 't': 1e3, 'thousand': 1e3, 'tusen': 1e3,
+    'm': 1e6, 'mm': 1e6, 'mn': 1e6, 'mln': 1e6, 'mio': 1e6, 'mill': 1e6, 'million': 1e6, 'millions': 1e6,
+    'millioner': 1e6,
+    'b': 1e9, 'bn': 1e9, 'mrd': 1e9, 'billion': 1e9, 'billions': 1e9, 'milliarder': 1e9,
+}
+# Currency codes that may follow the amount or be glued to its unit ("12 mnok", "5 meur")
+CURRENCY_CODES = ('nok', 'eur', 'usd', 'sek', 'dkk', 'gbp', 'kr')
+
+# The amount (digits with '.', ',', ' ' or "'" separators) and the word right after it;
+# a minus sign before it or accounting parentheses make it negative
+_AMOUNT_PATTERN = r"(?P<number>\d(?:[\d.,' ]*\d)?)\s*(?P<unit>[a-z]*)"
+_NEGATIVE_PATTERN = r'^\s*\(.*\)\s*$|^[^\d]*[-−]'
+# Only thousands separators: 1,200 / 1 200 / 1.200.000 (a single dot is a decimal mark)
+_GROUPED_PATTERN = r"^\d{1,3}(?:(?:[, ']\d{3})+|(?:\.\d{3}){2,})$"
+
+
+def _unit_scale(token):
+    """Multiplier of a unit token (NaN if it isn't a unit), or None for a bare amount."""
+    for code in CURRENCY_CODES:
+        if token.endswith(code):
+            token = token[:-len(code)]
+            break
+    if not token:
+        return None
+    return UNIT_SCALES.get(token, np.nan)
+
+
+def _normalize_number(number):
+    """Digit strings with mixed separators -> '1234.5' strings, on a whole Series."""
+    number = number.str.replace(r"[ ']", '', regex=True)
+    has_comma = number.str.contains(',', regex=False)
+    has_dot = number.str.contains('.', regex=False)
+    # With both separators, the last one is the decimal mark
+    comma_decimal = has_comma & (~has_dot | (number.str.rfind(',') > number.str.rfind('.')))
+    number = number.where(~comma_decimal, number.str.replace('.', '', regex=False).str.replace(',', '.', regex=False))
+    number = number.where(comma_decimal | ~has_comma, number.str.replace(',', '', regex=False))
+    return number
+
+
+def parse_money(values, unit='m'):
+    """Parses a column of amounts into floats in `unit` ('k' for thousands, 'm' for millions, 'bn').
+
+    Numbers are taken to already be in `unit`. Texts may carry currency symbols
+    or codes, a k/m/bn-style suffix, comma or dot decimals, thousands separators
+    and a minus sign or accounting parentheses. Anything else becomes NaN.
+    """
+    values = pd.Series(values)
+    target_scale = UNIT_SCALES[unit]
+    amounts = pd.to_numeric(values, errors='coerce').astype(float)
+
+    texts = values[amounts.isna() & values.notna()]
+    if len(texts) == 0:
+        return amounts
+
+    texts = texts.astype(str).str.strip().str.lower()
+    parts = texts.str.extract(_AMOUNT_PATTERN)
+    grouped = parts['number'].str.match(_GROUPED_PATTERN, na=False)
+    number = parts['number'].where(~grouped, parts['number'].str.replace(r"[,. ']", '', regex=True))
+    number = pd.to_numeric(_normalize_number(number), errors='coerce')
+
+    # One lookup per distinct unit token
+    tokens = parts['unit'].fillna('').astype('category')
+    token_scales = np.array(
+        [target_scale if scale is None else scale for scale in map(_unit_scale, tokens.cat.categories)], dtype=float
+    )
+    scales = token_scales[tokens.cat.codes.to_numpy()]
+    sign = np.where(texts.str.contains(_NEGATIVE_PATTERN, regex=True), -1.0, 1.0)
+
+    amounts.loc[texts.index] = number.to_numpy() * scales / target_scale * sign
+    return amounts
+
+
+def money_labels(amounts, raw_values, template):
+    """Display strings for parsed amounts: `template` with the amount, the raw text
+    if it couldn't be parsed, or 'N/A' if there is none."""
+    raw_text = pd.Series(raw_values, index=amounts.index).astype(str).str.strip()
+    raw_text = raw_text.where(pd.Series(raw_values, index=amounts.index).notna() & (raw_text != ''), 'N/A')
+    prefix, suffix = template.split('{}')
+    # Plain numbers (taken as the amount) keep their raw text, as in the original report ("12" -> €12m,
+    # 2.0 -> €2.0m); converted amounts are shown without a trailing '.0' ("€1.2bn" -> €1200m)
+    amount_text = raw_text.where(raw_text.str.fullmatch(r'-?\d+(?:\.\d+)?'),
+                                 amounts.astype(str).str.replace(r'\.0$', '', regex=True))
+    return (prefix + amount_text + suffix).where(amounts.notna(), raw_text)
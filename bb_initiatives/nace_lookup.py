@@ -0,0 +1,108 @@
+# nace_lookup.py
+
+import functools
+import itertools
+import re
+
+from .taxonomy import nace_to_subcategory_map
+
+# Leading NACE code of a register cell, e.g. '41.201' from '41.201 - Bygging av bygninger'
+# (note that the first alternative wins, so undotted codes like '41201' resolve as '41')
+NACE_CODE_PATTERN = r'^\s*(\d{2}(?:\.\d{1,3})?|\d{4,5})'
+_NACE_CODE_RE = re.compile(NACE_CODE_PATTERN)
+
+# Digits of a normalized (undotted) code
+NACE_MIN_DIGITS = 2
+NACE_MAX_DIGITS = 5
+
+
+def _resolve_code(code, nace_map):
+    """Longest-prefix lookup of a normalized code: 'xx.yy' -> 'xx.y' -> 'xx'."""
+    prefixes_to_try = []
+    if len(code) >= 4:
+        prefixes_to_try.append(f"{code[:2]}.{code[2:4]}")
+    if len(code) >= 3:
+        prefixes_to_try.append(f"{code[:2]}.{code[2]}")
+    prefixes_to_try.append(code[:2])
+    for prefix in prefixes_to_try:
+        if prefix in nace_map:
+            return nace_map[prefix]
+    return None
+
+
+def build_nace_table(nace_map):
+    """Flat table of every normalized NACE code (2 to 5 digits) that resolves to a (Segment, Subcategory).
+
+    Only codes sharing a division (first two digits) with a key of `nace_map`
+    can resolve, so the table holds at most 1,111 codes per mapped division.
+    """
+    table = {}
+    for division in sorted({key[:2] for key in nace_map}):
+        for extra_digits in range(NACE_MAX_DIGITS - NACE_MIN_DIGITS + 1):
+            for digits in itertools.product('0123456789', repeat=extra_digits):
+                code = division + ''.join(digits)
+                resolved = _resolve_code(code, nace_map)
+                if resolved is not None:
+                    table[code] = resolved
+    return table
+
+
+class NaceLookup:
+    """NACE code text -> (Segment, Subcategory), through a precomputed code table.
+
+    `map` resolves a whole Series with one `str.extract` and a lookup per
+    distinct code (via categorical codes), instead of a regex and several dict
+    probes per row.
+    """
+
+    def __init__(self, nace_map):
+        self.nace_map = nace_map
+        self.table = build_nace_table(nace_map)
+        self._segments = {code: segment for code, (segment, _) in self.table.items()}
+        self._subcategories = {code: subcategory for code, (_, subcategory) in self.table.items()}
+
+    def resolve(self, nace_code_text):
+        """(Segment, Subcategory) for one cell, or (None, None)."""
+        if nace_code_text is None:
+            return None, None
+        # Missing cells (NaN, NA) have no leading code
+        match = _NACE_CODE_RE.match(str(nace_code_text))
+        if not match:
+            return None, None
+        return self.table.get(match.group(1).replace('.', ''), (None, None))
+
+    def map(self, nace_codes):
+        """Segment and Subcategory arrays (NaN where unmapped) for a Series of NACE code texts."""
+        # Imported here so single lookups (resolve) don't pay for pandas
+        import numpy as np
+        import pandas as pd
+
+        codes = (
+            pd.Series(nace_codes).astype(str)
+            .str.extract(NACE_CODE_PATTERN, expand=False)
+            .str.replace('.', '', regex=False)
+            .astype('category')
+        )
+        categories = codes.cat.categories
+        # Label -1 (no code) picks the trailing NaN
+        labels = codes.cat.codes.to_numpy()
+        segments = np.append(categories.map(self._segments).to_numpy(object), np.nan)
+        subcategories = np.append(categories.map(self._subcategories).to_numpy(object), np.nan)
+        return segments[labels], subcategories[labels]
+
+
+@functools.lru_cache(maxsize=None)
+def default_nace_lookup():
+    """NaceLookup over the taxonomy's NACE mapping, built on first use."""
+    return NaceLookup(nace_to_subcategory_map)
+
+
+def get_subcategory_from_nace(nace_code_text):
+    """Extracts NACE code and maps it to a (Segment, Subcategory) tuple."""
+    # e.g. '41.201 - Bygging av bygninger' -> '41201' -> most specific prefix in the map ('41')
+    return default_nace_lookup().resolve(nace_code_text)
+
+
+def map_nace_codes(nace_codes):
+    """Segment and Subcategory arrays for a Series of NACE code texts (vectorized)."""
+    return default_nace_lookup().map(nace_codes)
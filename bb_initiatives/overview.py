@@ -0,0 +1,272 @@
+# overview.py
+#
+# B&B initiatives pipeline: classifies the companies of 'B&B platforms and addons.xlsx' into
+# segments and subcategories, identifies platforms and add-ons, and writes
+# bb_initiatives_overview.xlsx, construction_segments.csv and bb_initiatives_overview.html.
+
+import argparse
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from .categories import as_categorical, counts_by_appearance
+from .classification_cache import open_classification_cache
+from .classify import overview_classifier
+from .company_table import CompanyTable
+from .excel_cache import read_excel_cached
+from .initiatives import build_initiatives, company_keys, summarize_initiatives
+from .investment_types import classify_investments, classify_investments_without_dates
+from .investors import INVESTOR_ALIASES_FILE, InvestorDimension, load_investor_aliases
+from .memory_report import MemoryReport
+from .money import money_labels, parse_money
+from .overview_report import REPORT_MODES, write_overview_html
+from .platforms_reader import (FINANCING_DATE, FINANCING_DATE_ISO, FINANCING_YEAR, add_financing_dates,
+                               date_cells, platform_date_column, read_platforms)
+from .taxonomy import segments_data
+
+
+def segments_frame():
+    """The segment keywords as a (Segment, Keyword) DataFrame."""
+    return pd.DataFrame([(segment, keyword)
+                         for segment, keywords in segments_data.items()
+                         for keyword in keywords],
+                        columns=['Segment', 'Keyword'])
+
+
+def add_arguments(parser):
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Processes for keyword classification (default: all cores; 1 = serial). "
+                             "Small inputs are always classified serially.")
+    parser.add_argument('--investor-aliases', default=INVESTOR_ALIASES_FILE,
+                        help="JSON file of investor aliases, e.g. {\"EQT Partners\": \"EQT\"} (default: %(default)s, if present).")
+    parser.add_argument('--memory-report', action='store_true',
+                        help="Print the memory use (memory_usage(deep=True)) of each DataFrame after each stage.")
+    parser.add_argument('--report-mode', choices=REPORT_MODES, default='markup',
+                        help="HTML report: every company card as markup (default); 'shared': as markup, with each "
+                             "company's card body written once per segment and copied into its cards by the page; "
+                             "or 'data': one compact JSON payload from which the page builds the cards in the browser.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Classify B&B platforms/add-ons and build the initiatives overview.")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+def run(args):
+    """Runs the overview pipeline in the working directory (see add_arguments for `args`)."""
+    taxonomy_classifier = overview_classifier()
+    memory_report = MemoryReport(enabled=args.memory_report)
+
+    # Read the Excel files, using row 7 as headers
+    # The platforms sheet is streamed row by row, keeping only the columns used below and
+    # skipping blank rows; the investors sheet is read whole with empty rows and columns removed.
+    # Both are kept in Arrow sidecars (.excel_cache/) so later runs skip parsing unchanged workbooks
+    print("\nReading Excel files...")
+    df_platforms = read_platforms('B&B platforms and addons.xlsx', sheet_name='Data')
+    df_investors = read_excel_cached('B&B investors.xlsx', header=6)
+    memory_report.record('loaded', df_platforms=df_platforms, df_investors=df_investors)
+
+    # --- Debug: Print platform columns to confirm new column name ---
+    print("\nDetected columns in Platforms/Addons sheet:")
+    print(df_platforms.columns.tolist())
+    # --- End Debug ---
+
+    print("\nPlatforms and Add-ons DataFrame structure:")
+    print("\nColumns:")
+    for col in df_platforms.columns:
+        print(f"- {col}")
+    print("\nFirst 3 rows of data:")
+    print(df_platforms.head(3))
+
+    print("\n" + "="*80 + "\n")
+
+    print("Investors DataFrame structure:")
+    print("\nColumns:")
+    for col in df_investors.columns:
+        print(f"- {col}")
+    print("\nFirst 3 rows of data:")
+    print(df_investors.head(3))
+
+    # Display the number of records in each DataFrame
+    print(f"\nNumber of platform/addon records: {len(df_platforms)}")
+    print(f"Number of investor records: {len(df_investors)}")
+
+    # Add segment and subcategory classification to platforms DataFrame
+    print("\nClassifying companies into segments...")
+    # Only companies that are new or edited since the last run (or hit by a taxonomy edit) are classified
+    classification_cache = open_classification_cache()
+    segments, subcategories = taxonomy_classifier.classify_frame(
+        df_platforms, cache=classification_cache, workers=args.workers
+    )
+    # Categoricals over every label the taxonomy can produce (sorted, so they order like the strings)
+    df_platforms['Segment'] = as_categorical(segments, taxonomy_classifier.segment_labels, index=df_platforms.index)
+    df_platforms['Subcategory'] = as_categorical(subcategories, taxonomy_classifier.subcategory_labels, index=df_platforms.index)
+    if classification_cache is not None:
+        print(f"Classification cache: {classification_cache.hits} reused, {classification_cache.misses} newly classified")
+        classification_cache.close()
+
+    # Create B&B initiatives overview
+    print("\nCreating B&B initiatives overview...")
+
+    # Define the expected date column name (WILL BE CONFIRMED/UPDATED from the header resolved by the reader)
+    DATE_COLUMN = 'Last Financing Date'
+
+    # --- Confirmation step: the reader keeps the financing-date column (by name, else column K) ---
+    ACTUAL_DATE_COLUMN_NAME = platform_date_column(df_platforms)
+    if ACTUAL_DATE_COLUMN_NAME is not None:
+        print(f"\nDEBUG: Identified financing date header: '{ACTUAL_DATE_COLUMN_NAME}'")
+        if ACTUAL_DATE_COLUMN_NAME != DATE_COLUMN:
+            print(f"INFO: Updating DATE_COLUMN to '{ACTUAL_DATE_COLUMN_NAME}' based on file header.")
+            DATE_COLUMN = ACTUAL_DATE_COLUMN_NAME # Update the variable
+        else:
+            print(f"INFO: Confirmed DATE_COLUMN '{DATE_COLUMN}' matches the file header.")
+    else:
+        print("\nWARNING: Could not identify the financing date column.")
+    # --- End Confirmation Step ---
+
+
+    # Check if the date column exists in the DataFrame columns
+    has_date_column = DATE_COLUMN in df_platforms.columns
+    if not has_date_column:
+        print(f"\nWarning: Column '{DATE_COLUMN}' not found after header check. Company years will not be added.")
+
+    # Parse the financing date once; year and ISO date are derived here and reused by every later stage
+    date_parse_failures = add_financing_dates(df_platforms, DATE_COLUMN if has_date_column else None)
+    if len(date_parse_failures):
+        examples = ', '.join(f"'{value}' ({company})" for company, value in date_parse_failures.head(5).itertuples(index=False))
+        print(f"Warning: Could not parse {len(date_parse_failures)} financing date(s); treated as unknown. Examples: {examples}")
+
+    # Investor dimension: every investor once, with normalized names, aliases resolved and an integer
+    # code, joined with the B&B investors sheet; initiatives and classification group on these codes
+    investor_dimension = InvestorDimension.build(
+        df_platforms['All investors'], reference=df_investors, aliases=load_investor_aliases(args.investor_aliases)
+    )
+    print(f"Investor dimension: {len(investor_dimension)} investors, {investor_dimension.matched} found in 'B&B investors.xlsx'")
+
+    # One row per (company, investor): investors are split and exploded column-wise,
+    # and company names get their financing year appended
+    df_initiatives = build_initiatives(df_platforms, investor_dimension, year_col=FINANCING_YEAR)
+
+    # Companies per investor and segment (with counts), sorted by Investor and Number of Companies
+    df_summary = summarize_initiatives(df_initiatives)
+    memory_report.record('initiatives', df_platforms=df_platforms, df_initiatives=df_initiatives, df_summary=df_summary)
+
+    # Save results to Excel
+    print("\nSaving results...")
+    with pd.ExcelWriter('bb_initiatives_overview.xlsx') as writer:
+        # Save company classifications (include the date column)
+        columns_to_save = ['Companies', 'All investors', 'Segment', 'Description']
+        if has_date_column:
+            columns_to_save.append(DATE_COLUMN)
+        else:
+            print(f"Warning: Date column '{DATE_COLUMN}' not found, will not be included in 'Company Classifications' sheet.")
+        
+        company_classifications = df_platforms[columns_to_save]
+        if has_date_column:
+            # Date cells back as dates (the reader keeps the column as text)
+            company_classifications = company_classifications.assign(**{DATE_COLUMN: date_cells(df_platforms[DATE_COLUMN])})
+        company_classifications.to_excel(
+            writer, sheet_name='Company Classifications', index=False
+        )
+    
+        # Save B&B initiatives overview (with Company Name (Year))
+        df_summary.to_excel(writer, sheet_name='B&B Initiatives', index=False)
+    
+        # Save segment statistics
+        segment_stats = counts_by_appearance(df_platforms['Segment']).reset_index()
+        segment_stats.columns = ['Segment', 'Number of Companies']
+        segment_stats.to_excel(writer, sheet_name='Segment Statistics', index=False)
+    
+        # Save investor statistics, with the investor's details from the B&B investors sheet
+        investor_stats = df_summary.groupby('Investor', observed=True)['Number of Companies'].sum().sort_values(ascending=False).reset_index()
+        investor_stats.columns = ['Investor', 'Total Companies']
+        investor_stats = investor_stats.merge(investor_dimension.table, on='Investor', how='left')
+        investor_stats.to_excel(writer, sheet_name='Investor Statistics', index=False)
+
+    print("\nResults have been saved to 'bb_initiatives_overview.xlsx'")
+
+    # Display some summary statistics
+    print("\nSegment Distribution:")
+    print(counts_by_appearance(df_platforms['Segment']))
+
+    print("\nTop 5 Investors by number of companies:")
+    print(df_summary.groupby('Investor', observed=True)['Number of Companies'].sum().sort_values(ascending=False).head())
+
+    # Save the segments DataFrame to CSV for future use
+    segments_frame().to_csv('construction_segments.csv', index=False)
+    print("\nDataFrame has been saved to 'construction_segments.csv'")
+
+    # ------------------------------------------------
+    # Platform vs. add-on identification
+    # ------------------------------------------------
+
+    print("\nIdentifying platform vs. add-on investments...")
+
+    # Revenue and EBITDA as floats in €m ("€1.2bn", "850k", "12,5m" are converted; plain numbers are €m)
+    for money_col in ('Revenue', 'EBITDA'):
+        if money_col in df_platforms.columns:
+            df_platforms[f'{money_col} (EUR m)'] = parse_money(df_platforms[money_col], unit='m')
+            # Display strings for the HTML report; unparseable texts are shown as they are
+            df_platforms[f'{money_col} label'] = money_labels(df_platforms[f'{money_col} (EUR m)'], df_platforms[money_col], '€{}m')
+        else:
+            df_platforms[f'{money_col} (EUR m)'] = np.nan
+            df_platforms[f'{money_col} label'] = 'N/A'
+
+    # Criteria for platform identification (see investment_types.classify_investments)
+    # 1. First acquisition in a segment by an investor
+    # 2. Larger revenue compared to the segment average (5x+)
+    # 3. Earlier acquisition date
+    if 'Last financing date' in df_platforms.columns:
+        print("Using 'Last financing date' for platform/add-on classification")
+        df_platforms['investment_type'], investment_counts = classify_investments(
+            df_platforms, df_platforms[FINANCING_DATE], revenue=df_platforms['Revenue (EUR m)'], investors=investor_dimension
+        )
+    else:
+        print("Warning: 'Last Financing Date' column not found. Using basic classification.")
+        # Without dates, each investor's first listed company in a segment is its platform
+        df_platforms['investment_type'], investment_counts = classify_investments_without_dates(df_platforms, investor_dimension)
+
+    print(f"Identified {investment_counts['Platform']} platforms and {investment_counts['Add-on']} add-ons")
+    memory_report.record('platform classification', df_platforms=df_platforms)
+
+    # ------------------------------------------------
+    # HTML Report Generation
+    # ------------------------------------------------
+
+    print("\nGenerating HTML report...")
+
+    # Company details: one compact record per company (keyed by Company ID, or the name when the
+    # ID is missing); the report groupings below only hold integer positions into this table
+    df_platforms['Company key'] = company_keys(df_platforms)
+    company_table = CompanyTable.from_frame(
+        df_platforms, key_col='Company key', year_col=FINANCING_YEAR, date_col=FINANCING_DATE_ISO,
+        revenue_col='Revenue label', ebitda_col='EBITDA label'
+    )
+
+    # Prepare data for HTML: Group by segment, then by investor (investors in alphabetical order,
+    # companies in row order); every segment gets an entry, even without initiatives
+    html_data = {segment: {} for segment in df_platforms['Segment'].unique()}
+    df_initiatives['Company position'] = company_table.lookup(df_initiatives['Company key'])
+    for (segment, investor), positions in df_initiatives.groupby(['Segment', 'Investor'], observed=True)['Company position']:
+        html_data[segment][investor] = positions.to_numpy()
+
+    # Order segments by number of companies
+    segments_ordered = counts_by_appearance(df_platforms['Segment']).index.tolist()
+
+    # Calculate some statistics for the dashboard
+    total_initiatives = len(df_summary)
+    total_companies = len(df_platforms)
+    total_investors = df_initiatives['Investor'].nunique()
+    total_segments = len(df_platforms['Segment'].unique())
+    last_updated = datetime.datetime.now().strftime('%Y-%m-%d')
+
+    # Save the HTML to a file (written as it is rendered)
+    write_overview_html(
+        'bb_initiatives_overview.html', html_data, segments_ordered, company_table, total_companies,
+        total_investors, total_segments, total_initiatives, last_updated, mode=args.report_mode
+    )
+
+    print("\nHTML report has been saved to 'bb_initiatives_overview.html'")
+    memory_report.print_summary()
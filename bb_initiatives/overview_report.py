@@ -0,0 +1,1020 @@
+# overview_report.py
+#
+# HTML rendering of the B&B initiatives overview (bb_initiatives_overview.html). The page is
+# produced as a stream of fragments by the template functions below (f-strings, compiled once
+# with the module); write_overview_html writes them to disk as they are rendered. In the data
+# report mode the sections are not written as markup: the page embeds them as one JSON payload
+# and builds them in the browser.
+
+import html
+import json
+
+from .html_writer import write_fragments
+
+# Define color palette for segments
+segment_colors = {
+    'Core Construction & Civil Engineering': '#3498db',  # Blue
+    'Specialized Trades': '#e74c3c',  # Red
+    'Mechanical, Electrical & HVAC': '#2ecc71',  # Green
+    'Marine, Offshore & Energy': '#f39c12',  # Orange
+    'Industrial Services & Manufacturing Support': '#9b59b6',  # Purple
+    'Building Products & Materials': '#1abc9c',  # Turquoise
+    'Tech & Software for Construction': '#34495e',  # Dark Blue
+    'Consulting, Advisory & Project Management': '#e67e22',  # Dark Orange
+    'Equipment Rental & Heavy Machinery': '#27ae60',  # Dark Green
+    'Facility Services & Real Estate Ops': '#c0392b',  # Dark Red
+    'Safety & Monitoring Systems': '#8e44ad',  # Dark Purple
+    'Environmental & Waste Management': '#16a085',  # Dark Turquoise
+    'Infrastructure & Public Works': '#f1c40f',  # Yellow
+    'Interior Design & Furnishing': '#7f8c8d',  # Gray
+    'Other': '#95a5a6'  # Light Gray
+}
+
+
+# Platform/add-on badge styles
+_CSS_WITH_BADGES = '''
+        .investment-type-badge {
+            /* Remove absolute positioning */
+            /* position: absolute; */ 
+            /* top: 0.5rem; */
+            /* left: 0.5rem; */
+            display: inline-block; /* Make it flow with text */
+            margin-right: 0.5rem; /* Add some space */
+            margin-bottom: 0.3rem; /* Add space below */
+            padding: 0.2rem 0.5rem;
+            border-radius: 4px;
+            font-size: 0.7rem;
+            font-weight: bold;
+            color: white;
+            text-transform: uppercase;
+            vertical-align: middle; /* Align with other inline elements */
+        }
+        
+        .platform-badge {
+            background-color: #2ecc71;  /* Green */
+        }
+        
+        .addon-badge {
+            background-color: #e74c3c;  /* Red */
+        }
+'''
+
+# Inert container of the investors past the first five (cloned into the page on first expand)
+_HIDDEN_INVESTORS_OPEN = '''
+                <template class="hidden-investors">'''
+_HIDDEN_INVESTORS_CLOSE = '''</template>'''
+
+# Card bodies of a segment's companies, stored once each (shared layout, see _render_segment)
+_COMPANY_BODIES_OPEN = '''
+                <template class="company-bodies">'''
+_COMPANY_BODIES_CLOSE = '''
+                </template>
+        '''
+
+# End of an investor section
+_INVESTOR_CLOSE = '''
+                    </div>
+                </div>
+        '''
+
+# End of a segment section
+_SEGMENT_CLOSE = '''
+            </div>
+    '''
+
+# Between the segment buttons and the segment sections
+_SEGMENTS_OPEN = '''
+        </div>
+        
+        <div id="initiatives-container">
+'''
+
+# Badge of each known investment type (no badge for 'Unknown')
+_INVESTMENT_TYPE_BADGES = {
+    'Platform': '<div class="investment-type-badge platform-badge">Platform</div>',
+    'Add-on': '<div class="investment-type-badge addon-badge">Add-on</div>',
+}
+
+# Investors shown before the "Show More Investors" button
+VISIBLE_INVESTORS = 5
+
+
+def _page_head(css_with_badges, total_companies, total_investors, total_segments, total_initiatives):
+    """Page up to the segment buttons: styles, header and the dashboard of totals."""
+    return f'''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Buy & Build Initiatives Overview - Construction & Engineering</title>
+    <style>
+        :root {{
+            --primary: #2c3e50;
+            --secondary: #34495e;
+            --accent: #3498db;
+            --light: #ecf0f1;
+            --dark: #2c3e50;
+            --success: #2ecc71;
+            --info: #3498db;
+            --warning: #f39c12;
+            --danger: #e74c3c;
+        }}
+        
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        }}
+        
+        body {{
+            background-color: #f5f7fa;
+            color: var(--dark);
+            line-height: 1.6;
+        }}
+        
+        .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+        }}
+        
+        header {{
+            background-color: var(--primary);
+            color: white;
+            padding: 1rem 0;
+            margin-bottom: 2rem;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        }}
+        
+        h1 {{
+            text-align: center;
+            font-size: 2.5rem;
+            margin-bottom: 0.5rem;
+        }}
+        
+        h2 {{
+            color: var(--primary);
+            margin: 1.5rem 0 1rem;
+            border-bottom: 2px solid var(--accent);
+            padding-bottom: 0.5rem;
+        }}
+        
+        .dashboard {{
+            display: flex;
+            justify-content: space-between;
+            margin-bottom: 2rem;
+            flex-wrap: wrap;
+        }}
+        
+        .stat-card {{
+            background-color: white;
+            border-radius: 8px;
+            padding: 1.5rem;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+            flex: 1;
+            min-width: 200px;
+            margin: 0.5rem;
+            text-align: center;
+            transition: transform 0.3s ease;
+        }}
+        
+        .stat-card:hover {{
+            transform: translateY(-5px);
+            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.15);
+        }}
+        
+        .stat-value {{
+            font-size: 2.5rem;
+            font-weight: bold;
+            color: var(--accent);
+            margin: 0.5rem 0;
+        }}
+        
+        .stat-label {{
+            font-size: 1rem;
+            color: var(--secondary);
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }}
+        
+        .segment-section {{
+            background-color: white;
+            border-radius: 8px;
+            padding: 1.5rem;
+            margin-bottom: 2rem;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+            border-top: 5px solid #3498db; /* Default color, will be overridden */
+        }}
+        
+        .segment-header {{
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 1rem;
+            cursor: pointer;
+        }}
+        
+        .segment-name {{
+            font-size: 1.5rem;
+            color: var(--primary);
+            font-weight: bold;
+        }}
+        
+        .segment-count {{
+            background-color: #3498db; /* Default color, will be overridden */
+            color: white;
+            padding: 0.25rem 0.75rem;
+            border-radius: 50px;
+            font-size: 0.9rem;
+        }}
+        
+        .investor-section {{
+            margin: 1rem 0 1rem 1.5rem;
+            padding-left: 1rem;
+            border-left: 3px solid #e1e4e8;
+        }}
+        
+        .investor-section.hidden-investor {{
+            display: none;
+        }}
+        
+        .investor-name {{
+            font-size: 1.2rem;
+            font-weight: 600;
+            color: var(--secondary);
+            margin-bottom: 0.5rem;
+        }}
+        
+        .company-list {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 1rem;
+            margin-top: 1rem;
+        }}
+        
+        .company-card {{
+            background-color: var(--light);
+            border-radius: 6px;
+            padding: 1rem;
+            flex: 1;
+            min-width: 250px;
+            position: relative;
+            transition: all 0.3s ease;
+        }}
+        
+        .company-card:hover {{
+            transform: translateY(-3px);
+            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
+        }}
+        
+        {css_with_badges}
+        
+        .subcategory-tag {{
+            display: inline-block;
+            padding: 0.15rem 0.5rem;
+            font-size: 0.75rem;
+            border-radius: 3px;
+            margin-bottom: 0.5rem;
+            color: white;
+            font-weight: 500;
+            opacity: 0.8;
+        }}
+        
+        .company-name {{
+            font-weight: bold;
+            font-size: 1.1rem;
+            margin-bottom: 0.5rem;
+            color: var(--dark);
+        }}
+        
+        .acquisition-year {{
+            position: absolute;
+            /* top: 0.5rem; */ /* Remove top positioning */
+            bottom: 0.5rem; /* Add bottom positioning */
+            right: 0.5rem;
+            color: white;
+            padding: 0.2rem 0.5rem;
+            border-radius: 4px;
+            font-size: 0.8rem;
+        }}
+        
+        .company-description {{
+            font-size: 0.9rem;
+            color: var(--secondary);
+            margin-top: 0.5rem;
+            display: none;
+        }}
+        
+        .show-description {{
+            background-color: var(--accent);
+            color: white;
+            border: none;
+            padding: 0.4rem 0.8rem;
+            border-radius: 4px;
+            cursor: pointer;
+            font-size: 0.8rem;
+            margin-top: 0.5rem;
+        }}
+        
+        .show-description:hover {{
+            background-color: var(--info);
+        }}
+        
+        .show-more-button {{
+            display: block;
+            margin: 1rem auto;
+            background-color: #f5f7fa;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+            padding: 0.5rem 1rem;
+            cursor: pointer;
+            transition: all 0.3s ease;
+            font-size: 0.9rem;
+        }}
+        
+        .show-more-button:hover {{
+            background-color: #e8eaed;
+        }}
+        
+        .subcategory-filters {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+            margin-bottom: 1rem;
+            margin-top: 0.5rem;
+            padding-bottom: 0.5rem;
+            border-bottom: 1px solid #eee;
+        }}
+        
+        .subcategory-filter {{
+            background-color: white;
+            color: inherit;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+            padding: 0.2rem 0.6rem;
+            cursor: pointer;
+            transition: all 0.3s ease;
+            font-size: 0.8rem;
+        }}
+        
+        .subcategory-filter.active {{
+            background-color: #f5f7fa;
+            font-weight: bold;
+            box-shadow: inset 0 0 0 1px currentColor;
+        }}
+        
+        .subcategory-filter:hover {{
+            background-color: #f5f7fa;
+        }}
+        
+        .segment-buttons-container {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+            margin-bottom: 2rem;
+        }}
+        
+        .segment-button {{
+            background-color: white;
+            color: white;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+            padding: 0.5rem 1rem;
+            cursor: pointer;
+            transition: all 0.3s ease;
+            font-size: 0.9rem;
+        }}
+        
+        .segment-button[data-segment="all"] {{
+            background-color: var(--primary);
+            border-color: var(--primary);
+        }}
+        
+        .segment-button:hover {{
+            opacity: 0.9;
+            transform: translateY(-2px);
+        }}
+        
+        .segment-button.active {{
+            box-shadow: 0 0 0 2px white, 0 0 0 4px currentColor;
+        }}
+        
+        footer {{
+            text-align: center;
+            margin-top: 3rem;
+            padding: 1rem;
+            background-color: var(--primary);
+            color: white;
+        }}
+        
+        .hidden {{
+            display: none;
+        }}
+        
+        @media (max-width: 768px) {{
+            .dashboard {{
+                flex-direction: column;
+            }}
+            
+            .stat-card {{
+                margin-bottom: 1rem;
+            }}
+            
+            .company-card {{
+                min-width: 100%;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <header>
+        <div class="container">
+            <h1>Buy & Build Initiatives Overview - Construction & Engineering</h1>
+            <p style="text-align: center; color: #ccc;">Analysis of construction industry consolidation in Norway and Sweden</p>
+        </div>
+    </header>
+    
+    <div class="container">
+        <div class="dashboard">
+            <div class="stat-card">
+                <div class="stat-label">Total Companies</div>
+                <div class="stat-value">{total_companies}</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Investors</div>
+                <div class="stat-value">{total_investors}</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Segments</div>
+                <div class="stat-value">{total_segments}</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Initiatives</div>
+                <div class="stat-value">{total_initiatives}</div>
+            </div>
+        </div>
+        
+        <div class="segment-buttons-container">
+            <button class="segment-button active" data-segment="all">All Segments</button>
+'''
+
+
+def _segment_button(segment, segment_color):
+    """Segment button (after the "All Segments" button)."""
+    segment = html.escape(segment, quote=True)
+    return f'''
+            <button class="segment-button" 
+                    data-segment="{segment}" 
+                    style="background-color: {segment_color}; border-color: {segment_color};">
+                {segment}
+            </button>'''
+
+
+def _segment_open(segment, segment_color, segment_companies_count):
+    """Segment section: header, count and the subcategory filter container (filled in by the script)."""
+    segment = html.escape(segment, quote=True)
+    return f'''
+            <div class="segment-section" data-segment="{segment}" style="border-top-color: {segment_color}">
+                <div class="segment-header">
+                    <div class="segment-name">{segment}</div>
+                    <div class="segment-count" style="background-color: {segment_color}">{segment_companies_count} companies</div>
+                </div>
+                <div class="subcategory-filters" data-segment="{segment}">
+                    <button class="subcategory-filter active" data-subcategory="all" style="border-color: {segment_color}">All</button>
+                </div>
+    '''
+
+
+def _investor_open(investor, extra_class):
+    """Investor section (' hidden-investor' past the first five) and its company list."""
+    investor = html.escape(investor, quote=True)
+    return f'''
+                <div class="investor-section{extra_class}" data-investor="{investor}">
+                    <div class="investor-name">{investor}</div>
+                    <div class="company-list">
+        '''
+
+
+def _company_body(company, segment_color):
+    """Contents of a company card (texts escaped, as in the data report); its details are rendered by
+    the page script when "Show Details" is clicked."""
+    return f'''
+                            <div class="acquisition-year" style="background-color: {segment_color}">{company.year}</div>
+                            {_INVESTMENT_TYPE_BADGES.get(company.investment_type, '')}
+                            <div class="subcategory-tag" style="background-color: {segment_color}">{html.escape(company.subcategory, quote=True)}</div>
+                            <div class="company-name">{html.escape(company.base_name, quote=True)}</div>
+                            <button class="show-description" style="background-color: {segment_color}">Show Details</button>'''
+
+
+def _company_card(company, company_id, body):
+    """Company card of the markup layout."""
+    return f'''
+                        <div class="company-card" data-company="{html.escape(company.base_name, quote=True)}" data-company-id="{company_id}" data-investment-type="{html.escape(company.investment_type, quote=True)}">{body}
+                        </div>
+            '''
+
+
+def _company_ref(company, company_id):
+    """Empty card of the shared layout; the page script copies in the company's body from the segment's template."""
+    return f'''
+                        <div class="company-card company-ref" data-company="{html.escape(company.base_name, quote=True)}" data-company-id="{company_id}" data-investment-type="{html.escape(company.investment_type, quote=True)}"></div>'''
+
+
+def _shared_body(company_id, body):
+    """A company's card body in the segment's template (shared layout)."""
+    return f'''
+                    <div data-company-id="{company_id}">{body}
+                    </div>'''
+
+
+def _show_more_button(segment, more_investors):
+    """Shown in segments with more than five investors."""
+    return f'''
+                <button class="show-more-button" data-segment="{html.escape(segment, quote=True)}" data-expanded="false">
+                    Show More Investors ({more_investors} more)
+                </button>
+        '''
+
+
+def _page_foot(last_updated):
+    """Footer (the page script follows)."""
+    return f'''
+        </div>
+    </div>
+    
+    <footer>
+        <div class="container">
+            <p>Last updated: {last_updated}</p>
+            <p>Generated from Buy & Build Initiatives Analysis</p>
+        </div>
+    </footer>
+    
+'''
+
+
+# Filtering and toggling. Each segment has one delegated click listener; filters use the segment's
+# filter index (see overview_filter_index) instead of reading the cards: the matching cards are an
+# intersection of two sorted card lists, marked with a class while the segment is filtered. Detail
+# panels are built from the details lookup (see overview_details) when first shown, and the investors
+# past the first five are moved out of their <template> when the segment is first expanded
+_PAGE_SCRIPT = '''    <script>
+        const filterIndexes = JSON.parse(document.getElementById('overview-filters').textContent);
+        const companyDetails = JSON.parse(document.getElementById('overview-details').textContent);
+        const detailLabels = ['Acquired', 'Revenue', 'EBITDA', 'Description'];
+
+        // Cards in both sorted lists of card numbers
+        function intersectSorted(a, b) {
+            const result = [];
+            let i = 0, j = 0;
+            while (i < a.length && j < b.length) {
+                if (a[i] < b[j]) i++;
+                else if (a[i] > b[j]) j++;
+                else { result.push(a[i]); i++; j++; }
+            }
+            return result;
+        }
+
+        function filterButton(label, attribute, value, borderColor, active) {
+            const button = document.createElement('button');
+            button.className = active ? 'subcategory-filter active' : 'subcategory-filter';
+            button.setAttribute(attribute, value);
+            button.textContent = label;
+            if (borderColor) button.style.borderColor = borderColor;
+            return button;
+        }
+
+        // Detail panel of a company card: date, revenue, EBITDA and description
+        function detailsPanel(companyId) {
+            const panel = document.createElement('div');
+            panel.className = 'company-description';
+            companyDetails[companyId].forEach((value, field) => {
+                const paragraph = document.createElement('p');
+                const label = document.createElement('strong');
+                label.textContent = `${detailLabels[field]}:`;
+                paragraph.append(label, ` ${value}`);
+                panel.appendChild(paragraph);
+            });
+            return panel;
+        }
+
+        document.querySelectorAll('.segment-section').forEach(segment => {
+            const index = filterIndexes[segment.getAttribute('data-segment')];
+            // Shared layout: copy each company's card body (stored once per segment) into its cards
+            const companyBodies = segment.querySelector('template.company-bodies');
+            const bodies = new Map(companyBodies
+                ? [...companyBodies.content.children].map(body => [body.getAttribute('data-company-id'), body])
+                : []);
+            function fillCards() {
+                [...segment.getElementsByClassName('company-ref')].forEach(card => {
+                    card.append(...bodies.get(card.getAttribute('data-company-id')).cloneNode(true).childNodes);
+                    card.classList.remove('company-ref');
+                });
+            }
+            fillCards();
+            const subcategoryCards = new Map(index.subcategories);
+            const typeCards = new Map(index.types);
+            const cards = segment.getElementsByClassName('company-card');
+            const investorSections = segment.getElementsByClassName('investor-section');
+            // Investor section number of each card (an investor's cards are consecutive). The cards of
+            // investors still in the template are numbered after the others, as they are added in place
+            const cardInvestors = new Uint32Array(index.cardCount);
+            index.investorStarts.forEach((start, investor) => cardInvestors.fill(investor, start));
+
+            // Subcategory filters (in order of first appearance), then the investment type filters
+            const filterContainer = segment.querySelector('.subcategory-filters');
+            const segmentColor = getComputedStyle(segment).borderTopColor;
+            subcategoryCards.forEach((_, subcategory) => {
+                filterContainer.appendChild(filterButton(subcategory, 'data-subcategory', subcategory, segmentColor));
+            });
+            const divider = document.createElement('div');
+            divider.style.borderTop = '1px solid #eee';
+            divider.style.margin = '0.5rem 0';
+            divider.style.width = '100%';
+            filterContainer.appendChild(divider);
+            const filterHeading = document.createElement('div');
+            filterHeading.textContent = 'Filter by investment type:';
+            filterHeading.style.fontSize = '0.8rem';
+            filterHeading.style.marginBottom = '0.3rem';
+            filterContainer.appendChild(filterHeading);
+            const typeFilters = document.createElement('div');
+            typeFilters.style.display = 'flex';
+            typeFilters.style.gap = '0.5rem';
+            typeFilters.appendChild(filterButton('All Types', 'data-investment-type', 'all', null, true));
+            typeFilters.appendChild(filterButton('Platforms', 'data-investment-type', 'Platform', '#2ecc71'));
+            typeFilters.appendChild(filterButton('Add-ons', 'data-investment-type', 'Add-on', '#e74c3c'));
+            filterContainer.appendChild(typeFilters);
+
+            const filters = {subcategory: 'all', investmentType: 'all'};
+            let matchedCards = [];
+            let matchedInvestors = [];
+
+            function applyFilters() {
+                matchedCards.forEach(card => card.classList.remove('match'));
+                matchedInvestors.forEach(investor => investor.classList.remove('has-match'));
+                const lists = [];
+                if (filters.subcategory !== 'all') lists.push(subcategoryCards.get(filters.subcategory) || []);
+                if (filters.investmentType !== 'all') lists.push(typeCards.get(filters.investmentType) || []);
+                if (lists.length === 0) {
+                    matchedCards = [];
+                    matchedInvestors = [];
+                    segment.classList.remove('filtering');
+                    return;
+                }
+                const selected = lists.length === 1 ? lists[0] : intersectSorted(lists[0], lists[1]);
+                // Cards of investors not added yet are skipped (they are marked once added)
+                matchedCards = selected.map(number => cards[number]).filter(card => card);
+                matchedInvestors = [...new Set(selected.map(number => cardInvestors[number]))]
+                    .map(number => investorSections[number]).filter(investor => investor);
+                matchedCards.forEach(card => card.classList.add('match'));
+                matchedInvestors.forEach(investor => investor.classList.add('has-match'));
+                segment.classList.add('filtering');
+            }
+
+            segment.addEventListener('click', event => {
+                const button = event.target.closest('button');
+                if (!button || !segment.contains(button)) return;
+
+                if (button.classList.contains('show-description')) {
+                    // Toggle description visibility (the panel is built on first use)
+                    let description = button.nextElementSibling;
+                    if (!description) {
+                        description = detailsPanel(button.closest('.company-card').getAttribute('data-company-id'));
+                        button.after(description);
+                    }
+                    const show = description.style.display !== 'block';
+                    description.style.display = show ? 'block' : 'none';
+                    button.textContent = show ? 'Hide Details' : 'Show Details';
+                } else if (button.classList.contains('show-more-button')) {
+                    // Toggle the investors past the first five
+                    const hiddenInvestors = segment.querySelector('template.hidden-investors');
+                    if (hiddenInvestors) {
+                        hiddenInvestors.replaceWith(hiddenInvestors.content);
+                        fillCards();
+                        applyFilters();
+                    }
+                    const expanded = segment.classList.toggle('investors-expanded');
+                    button.setAttribute('data-expanded', String(expanded));
+                    const hiddenCount = segment.getElementsByClassName('hidden-investor').length;
+                    button.textContent = expanded ? 'Show Less' : `Show More Investors (${hiddenCount} more)`;
+                } else if (button.classList.contains('subcategory-filter')) {
+                    const attribute = button.hasAttribute('data-subcategory') ? 'data-subcategory' : 'data-investment-type';
+                    segment.querySelectorAll(`.subcategory-filter[${attribute}]`).forEach(btn => btn.classList.remove('active'));
+                    button.classList.add('active');
+                    filters[attribute === 'data-subcategory' ? 'subcategory' : 'investmentType'] = button.getAttribute(attribute);
+                    applyFilters();
+                }
+            });
+        });
+
+        // Segment toggle functionality
+        const segmentButtons = document.querySelectorAll('.segment-button');
+        let activeSegment = 'all';
+
+        segmentButtons.forEach(button => {
+            button.addEventListener('click', function() {
+                const segment = this.getAttribute('data-segment');
+
+                // If clicking the already active segment, reset to show all
+                if (segment === activeSegment && segment !== 'all') {
+                    document.querySelector('button[data-segment="all"]').classList.add('active');
+                    this.classList.remove('active');
+                    activeSegment = 'all';
+                    document.querySelectorAll('.segment-section').forEach(section => {
+                        section.style.display = '';
+                    });
+                } else {
+                    segmentButtons.forEach(btn => btn.classList.remove('active'));
+                    this.classList.add('active');
+                    activeSegment = segment;
+                    document.querySelectorAll('.segment-section').forEach(section => {
+                        if (segment === 'all') {
+                            section.style.display = '';
+                        } else {
+                            section.style.display = section.getAttribute('data-segment') === segment ? '' : 'none';
+                        }
+                    });
+                }
+            });
+        });
+    </script>
+</body>
+</html>
+'''
+
+
+# Filtering (see _PAGE_SCRIPT): while a segment is filtered only its matching cards, and the
+# investor sections having one, are shown. Expanded segments show the investors past the first five.
+_CSS_FILTERS = '''
+        .segment-section.investors-expanded .investor-section.hidden-investor {
+            display: block;
+        }
+
+        .segment-section.filtering .company-card:not(.match),
+        .segment-section.filtering .investor-section:not(.has-match) {
+            display: none;
+        }
+'''
+
+
+def _year_sort_key(company):
+    # Treat 'Unknown' or non-integer years as negative infinity, to place them last in descending sort
+    year = company.year
+    if isinstance(year, int):
+        return year
+    return float('-inf')
+
+
+def _ordered_investors(investors):
+    """(investor, positions) pairs of a segment, by number of companies (descending)."""
+    return sorted(investors.items(), key=lambda x: len(x[1]), reverse=True)
+
+
+def _ordered_positions(positions, company_table):
+    """Company positions by year, latest first (unknown years last)."""
+    return sorted(positions, key=lambda position: _year_sort_key(company_table[position]), reverse=True)
+
+
+def _render_segment(segment, investors, company_table, shared=False):
+    """Fragments of one segment section: investors by number of companies, their companies by year.
+
+    With `shared`, the body of each company's card is written once, in a
+    template at the start of the section, and its cards under each investor
+    are empty references filled in by the page script.
+    """
+    segment_companies_count = sum(len(companies) for companies in investors.values())
+    segment_color = segment_colors.get(segment, '#3498db')  # Default to blue if segment not in colors dict
+    yield _segment_open(segment, segment_color, segment_companies_count)
+
+    sorted_investors = _ordered_investors(investors)
+    if shared:
+        yield _COMPANY_BODIES_OPEN
+        # Each company once (a company listed under several investors has one card per investor)
+        for position in dict.fromkeys(position for _, positions in sorted_investors for position in positions):
+            company_id = html.escape(str(company_table.keys[position]), quote=True)
+            yield _shared_body(company_id, _company_body(company_table[position], segment_color))
+        yield _COMPANY_BODIES_CLOSE
+
+    for idx, (investor, positions) in enumerate(sorted_investors):
+        # Investors beyond the first five are added to the page when "Show More Investors" is clicked
+        if idx == VISIBLE_INVESTORS:
+            yield _HIDDEN_INVESTORS_OPEN
+        yield _investor_open(investor, ' hidden-investor' if idx >= VISIBLE_INVESTORS else '')
+        for position in _ordered_positions(positions, company_table):
+            company = company_table[position]
+            # The page script reads the id back (getAttribute) to look up the company's details
+            company_id = html.escape(str(company_table.keys[position]), quote=True)
+            if shared:
+                yield _company_ref(company, company_id)
+            else:
+                yield _company_card(company, company_id, _company_body(company, segment_color))
+        yield _INVESTOR_CLOSE
+
+    if len(sorted_investors) > VISIBLE_INVESTORS:
+        yield _HIDDEN_INVESTORS_CLOSE
+        yield _show_more_button(segment, len(sorted_investors) - VISIBLE_INVESTORS)
+    yield _SEGMENT_CLOSE
+
+
+def overview_filter_index(html_data, segments, company_table):
+    """Filter index of each segment, in the page order of its cards (numbered from 0).
+
+    `subcategories` and `types` list the card numbers of each subcategory and
+    investment type (in order of first appearance); `investorStarts` holds the
+    number of the first card of each investor section and `cardCount` the
+    number of cards (including those of the investors added on expand).
+    """
+    index = {}
+    for segment in segments:
+        subcategories, types, investor_starts = {}, {}, []
+        card = 0
+        for _, positions in _ordered_investors(html_data[segment]):
+            investor_starts.append(card)
+            for position in _ordered_positions(positions, company_table):
+                company = company_table[position]
+                subcategories.setdefault(company.subcategory, []).append(card)
+                types.setdefault(company.investment_type, []).append(card)
+                card += 1
+        index[segment] = {
+            'subcategories': list(subcategories.items()), 'types': list(types.items()), 'investorStarts': investor_starts,
+            'cardCount': card,
+        }
+    return index
+
+
+def overview_details(html_data, segments, company_table):
+    """Detail panel data of each company on the page, by company key: [date, revenue, EBITDA, description]."""
+    details = {}
+    for segment in segments:
+        for positions in html_data[segment].values():
+            for position in positions:
+                key = str(company_table.keys[position])
+                if key not in details:
+                    company = company_table[position]
+                    details[key] = [company.date, company.revenue, company.ebitda, company.description]
+    return details
+
+
+# --- Data report: the sections are built in the browser from one embedded JSON payload ---
+
+# Company fields of the payload (one array per field, one entry per company)
+# (the detail panels' data is in the details lookup, see overview_details)
+PAYLOAD_COMPANY_FIELDS = ('id', 'name', 'year', 'subcategory', 'type')
+
+
+def overview_payload(html_data, segments_ordered, company_table):
+    """The overview as compact data: every company, investor and label stored once, referenced by index.
+
+    `companies` holds one array per field (subcategory and type as indexes
+    into `subcategories` and `types`); each segment lists its investors
+    (indexes into `investors`) with their companies (indexes into the company
+    arrays), in the order of the markup report.
+    """
+    segments = [segment for segment in segments_ordered if segment in html_data]
+    investors = sorted({investor for segment in segments for investor in html_data[segment]})
+    investor_indexes = {investor: index for index, investor in enumerate(investors)}
+    subcategories, types, company_indexes = {}, {}, {}
+    companies = {field: [] for field in PAYLOAD_COMPANY_FIELDS}
+
+    def company_index(position):
+        index = company_indexes.get(position)
+        if index is None:
+            company = company_table[position]
+            index = company_indexes[position] = len(company_indexes)
+            companies['id'].append(str(company_table.keys[position]))
+            companies['name'].append(company.base_name)
+            companies['year'].append(company.year)
+            companies['subcategory'].append(subcategories.setdefault(company.subcategory, len(subcategories)))
+            companies['type'].append(types.setdefault(company.investment_type, len(types)))
+        return index
+
+    segment_entries = []
+    for segment in segments:
+        segment_investors = [
+            [investor_indexes[investor], [company_index(int(position)) for position in _ordered_positions(positions, company_table)]]
+            for investor, positions in _ordered_investors(html_data[segment])
+        ]
+        segment_entries.append({
+            'name': segment, 'color': segment_colors.get(segment, '#3498db'),
+            'count': sum(len(positions) for _, positions in segment_investors), 'investors': segment_investors,
+        })
+
+    return {
+        'visibleInvestors': VISIBLE_INVESTORS, 'investors': investors, 'subcategories': list(subcategories),
+        'types': list(types), 'companies': companies, 'segments': segment_entries,
+    }
+
+
+def payload_json(payload):
+    """Compact JSON of a payload, safe inside a <script> element."""
+    # '<' only occurs in strings, where \u003c reads back as '<' ('</script>' can't end the element)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).replace('<', '\\u003c')
+
+
+# Builds the segment sections of the data report (the markup of the markup report, with the
+# company texts escaped) before the page script below runs
+_DATA_REPORT_SCRIPT = """
+        const escapeHtml = value => String(value).replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'})[c]);
+        const investmentTypeBadges = {
+            'Platform': '<div class="investment-type-badge platform-badge">Platform</div>',
+            'Add-on': '<div class="investment-type-badge addon-badge">Add-on</div>'
+        };
+
+        function renderCompanyCard(data, index, color) {
+            const companies = data.companies;
+            const type = data.types[companies.type[index]];
+            return `<div class="company-card" data-company="${escapeHtml(companies.name[index])}" data-company-id="${escapeHtml(companies.id[index])}" data-investment-type="${escapeHtml(type)}">`
+                + `<div class="acquisition-year" style="background-color: ${color}">${escapeHtml(companies.year[index])}</div>`
+                + (investmentTypeBadges[type] || '')
+                + `<div class="subcategory-tag" style="background-color: ${color}">${escapeHtml(data.subcategories[companies.subcategory[index]])}</div>`
+                + `<div class="company-name">${escapeHtml(companies.name[index])}</div>`
+                + `<button class="show-description" style="background-color: ${color}">Show Details</button></div>`;
+        }
+
+        function renderSegment(data, segment) {
+            const name = escapeHtml(segment.name);
+            const parts = [
+                `<div class="segment-section" data-segment="${name}" style="border-top-color: ${segment.color}">`,
+                `<div class="segment-header"><div class="segment-name">${name}</div>`,
+                `<div class="segment-count" style="background-color: ${segment.color}">${segment.count} companies</div></div>`,
+                `<div class="subcategory-filters" data-segment="${name}">`,
+                `<button class="subcategory-filter active" data-subcategory="all" style="border-color: ${segment.color}">All</button></div>`
+            ];
+            segment.investors.forEach(([investor, companyIndexes], position) => {
+                const investorName = escapeHtml(data.investors[investor]);
+                const hidden = position >= data.visibleInvestors ? ' hidden-investor' : '';
+                if (position === data.visibleInvestors) parts.push('<template class="hidden-investors">');
+                parts.push(`<div class="investor-section${hidden}" data-investor="${investorName}">`,
+                           `<div class="investor-name">${investorName}</div><div class="company-list">`);
+                companyIndexes.forEach(index => parts.push(renderCompanyCard(data, index, segment.color)));
+                parts.push('</div></div>');
+            });
+            const more = segment.investors.length - data.visibleInvestors;
+            if (more > 0) {
+                parts.push('</template>');
+                parts.push(`<button class="show-more-button" data-segment="${name}" data-expanded="false">Show More Investors (${more} more)</button>`);
+            }
+            parts.push('</div>');
+            return parts.join('');
+        }
+
+        (function () {
+            const data = JSON.parse(document.getElementById('overview-data').textContent);
+            const html = data.segments.map(segment => renderSegment(data, segment)).join('');
+            document.getElementById('initiatives-container').insertAdjacentHTML('beforeend', html);
+        })();
+"""
+
+
+def _render_data(html_data, segments_ordered, company_table):
+    """Fragments of the data report's sections: the JSON payload and the script building them."""
+    yield '        <script type="application/json" id="overview-data">'
+    yield payload_json(overview_payload(html_data, segments_ordered, company_table))
+    yield '</script>\n        <script>'
+    yield _DATA_REPORT_SCRIPT
+    yield '        </script>\n'
+
+
+# Report modes: 'markup' writes every section as HTML; 'shared' does too, with the card body of each company
+# written once per segment (see _render_segment); 'data' embeds the JSON payload and builds them in the browser
+REPORT_MODES = ('markup', 'shared', 'data')
+
+
+def render_overview_fragments(html_data, segments_ordered, company_table, total_companies, total_investors,
+                              total_segments, total_initiatives, last_updated, mode='markup'):
+    """The overview page as a stream of fragments: one section per segment (in `segments_ordered`),
+    investors by number of companies, and their companies (positions into `company_table`) by year,
+    latest first. See REPORT_MODES for `mode`."""
+    if mode not in REPORT_MODES:
+        raise ValueError(f"Unknown report mode {mode!r}; expected one of {REPORT_MODES}")
+    segments = [segment for segment in segments_ordered if segment in html_data]
+
+    yield _page_head(_CSS_WITH_BADGES + _CSS_FILTERS, total_companies, total_investors, total_segments, total_initiatives)
+    for segment in segments:
+        yield _segment_button(segment, segment_colors.get(segment, '#3498db'))
+    yield _SEGMENTS_OPEN
+
+    if mode == 'data':
+        yield from _render_data(html_data, segments, company_table)
+    else:
+        for segment in segments:
+            yield from _render_segment(segment, html_data[segment], company_table, shared=mode == 'shared')
+    yield '        <script type="application/json" id="overview-filters">'
+    yield payload_json(overview_filter_index(html_data, segments, company_table))
+    yield '</script>\n        <script type="application/json" id="overview-details">'
+    yield payload_json(overview_details(html_data, segments, company_table))
+    yield '</script>\n'
+
+    yield _page_foot(last_updated)
+    yield _PAGE_SCRIPT
+
+
+def render_overview_html(*args, **kwargs):
+    """The overview page as one string (see render_overview_fragments for the arguments)."""
+    return ''.join(render_overview_fragments(*args, **kwargs))
+
+
+def write_overview_html(path, *args, **kwargs):
+    """Writes the overview page to `path` as it is rendered (see render_overview_fragments for the arguments)."""
+    return write_fragments(path, render_overview_fragments(*args, **kwargs))
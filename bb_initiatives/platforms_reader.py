@@ -0,0 +1,185 @@
+# platforms_reader.py
+
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from .excel_cache import ExcelSidecar, iter_sheet_rows
+
+PLATFORMS_FILE = 'B&B platforms and addons.xlsx'
+PLATFORMS_SHEET = 'Data'
+# 1-based row holding the column headers of the PitchBook export
+PLATFORMS_HEADER_ROW = 7
+
+# Columns of the 'Data' sheet used by the B&B overview, besides the financing date.
+# Text columns are read as strings; the others keep the cell values (numbers, text
+# like "€1.2bn") and get their dtype inferred per batch. The financing date is read
+# as text, with date cells in ISO format (the export mixes date cells and text dates).
+PLATFORM_COLUMNS = ['Company ID', 'Companies', 'All investors', 'Keywords', 'Description', 'Revenue', 'EBITDA']
+TEXT_COLUMNS = {'Company ID', 'Companies', 'All investors', 'Keywords', 'Description'}
+
+# The financing date is looked up by name first, then by its usual position (column K)
+DATE_COLUMN_NAME = 'Last financing date'
+DATE_COLUMN_INDEX = 10
+
+# Rows per yielded batch
+BATCH_ROWS = 5000
+
+
+def _text_value(value):
+    if value is None:
+        return np.nan
+    return value if isinstance(value, str) else str(value)
+
+
+def _cell_value(value):
+    return np.nan if value is None else value
+
+
+def _date_value(value):
+    if value is None:
+        return np.nan
+    # datetime.datetime is a datetime.date too
+    return value.isoformat() if isinstance(value, datetime.date) else str(value)
+
+
+class PlatformsReader:
+    """Streams the 'Data' sheet of the B&B platforms workbook in typed batches.
+
+    Uses openpyxl's read-only mode, so rows are parsed one at a time and only
+    the needed columns are kept: PLATFORM_COLUMNS (those present in the export)
+    plus the financing-date column. Rows that are blank in all of these columns
+    are skipped. Each batch is a DataFrame of at most `batch_size` rows, with a
+    running index over the kept rows; read() builds one frame of all of them.
+    """
+
+    def __init__(self, path=PLATFORMS_FILE, sheet_name=PLATFORMS_SHEET, header_row=PLATFORMS_HEADER_ROW,
+                 columns=PLATFORM_COLUMNS, batch_size=BATCH_ROWS):
+        self.path = path
+        self.sheet_name = sheet_name
+        self.header_row = header_row
+        self.wanted_columns = list(columns)
+        self.batch_size = batch_size
+        self.columns = None  # Resolved output columns, in sheet order
+        self.date_column = None  # Header of the financing-date column, if found
+        self.missing_columns = []
+
+    def _resolve_header(self, names):
+        """Maps the wanted column names (and the date column) to their sheet positions."""
+        positions = {}
+        for position, name in enumerate(names):
+            positions.setdefault(name, position)  # Duplicate headers: the first one wins
+
+        selected = {name: positions[name] for name in self.wanted_columns if name in positions}
+        self.missing_columns = [name for name in self.wanted_columns if name not in positions]
+
+        date_position = next(
+            (position for position, name in enumerate(names) if name.strip().lower() == DATE_COLUMN_NAME.lower()),
+            None,
+        )
+        if date_position is None and len(names) > DATE_COLUMN_INDEX and names[DATE_COLUMN_INDEX]:
+            date_position = DATE_COLUMN_INDEX
+        if date_position is not None and date_position not in selected.values():
+            self.date_column = names[date_position]
+            selected[self.date_column] = date_position
+
+        ordered = sorted(selected.items(), key=lambda item: item[1])
+        self.columns = [name for name, _ in ordered]
+        return [position for _, position in ordered]
+
+    def _converter(self, name):
+        if name == self.date_column:
+            return _date_value
+        return _text_value if name in TEXT_COLUMNS else _cell_value
+
+    def _frame(self, data, start):
+        count = len(data[0]) if data else 0
+        return pd.DataFrame(dict(zip(self.columns, data)), columns=self.columns,
+                            index=pd.RangeIndex(start, start + count))
+
+    def _column_batches(self, batch_size):
+        """(converted values of each column, index of the first row) per batch of rows; one batch
+        of all rows if `batch_size` is None. Values go straight into per-column lists."""
+        data = None
+        start = 0
+        for row in iter_sheet_rows(self.path, self.sheet_name, self.header_row, self._resolve_header):
+            if data is None:
+                converters = [self._converter(name) for name in self.columns]
+                data = [[] for _ in self.columns]
+            for values, convert, value in zip(data, converters, row):
+                values.append(convert(value))
+            if batch_size is not None and len(data[0]) >= batch_size:
+                yield data, start
+                start += len(data[0])
+                data = [[] for _ in self.columns]
+        if data is not None and data[0]:
+            yield data, start
+
+    def __iter__(self):
+        for data, start in self._column_batches(self.batch_size):
+            yield self._frame(data, start)
+
+    def read(self):
+        """All rows as one DataFrame (only the needed columns).
+
+        The rows are collected into one list per column and the frame is built
+        once at the end, so the parsed cells are never held both as batches and
+        as their concatenation. Memory is bounded by the projected sheet (the
+        overview needs the whole frame), not by the batch size.
+        """
+        for data, start in self._column_batches(None):
+            return self._frame(data, start)
+        return pd.DataFrame(columns=self.columns or [])
+
+
+def platform_date_column(df):
+    """The financing-date column of a frame read by PlatformsReader, or None."""
+    return next((col for col in df.columns if col not in PLATFORM_COLUMNS), None)
+
+
+def read_platforms(path=PLATFORMS_FILE, sheet_name=PLATFORMS_SHEET, batch_size=BATCH_ROWS):
+    """The projected platforms sheet, served from an Arrow sidecar when the workbook is unchanged."""
+    reader = PlatformsReader(path, sheet_name=sheet_name, batch_size=batch_size)
+    sidecar = ExcelSidecar(path, sheet_name=sheet_name, header=PLATFORMS_HEADER_ROW - 1,
+                           loader=reader.read, variant='platforms', columns=PLATFORM_COLUMNS + [DATE_COLUMN_NAME])
+    return sidecar.read()
+
+
+# Date cells as _date_value writes them (datetime.isoformat)
+_DATE_CELL_PATTERN = r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?'
+
+
+def date_cells(raw):
+    """The financing-date column as the workbook had it: date cells as datetimes, text dates as text."""
+    cells = raw.astype(object).where(raw.notna())
+    is_cell = raw.astype(str).str.fullmatch(_DATE_CELL_PATTERN).fillna(False).to_numpy(dtype=bool)
+    cells[is_cell] = pd.to_datetime(raw[is_cell], format='ISO8601').to_numpy(dtype=object)
+    return cells
+
+
+# Financing-date columns added by add_financing_dates
+FINANCING_DATE = 'Financing date'
+FINANCING_YEAR = 'Financing year'
+FINANCING_DATE_ISO = 'Financing date (ISO)'
+
+
+def add_financing_dates(df, date_column):
+    """Parses the financing-date column once into typed columns.
+
+    Adds FINANCING_DATE (datetime64, NaT when missing or unparseable),
+    FINANCING_YEAR (nullable Int64) and FINANCING_DATE_ISO ('YYYY-MM-DD' or NaN).
+    Every cell is parsed on its own terms (format='mixed'), as a per-cell
+    pd.to_datetime would. Returns the rows whose date could not be parsed, as a
+    DataFrame of company name and raw value.
+    """
+    if date_column is None or date_column not in df.columns:
+        raw = pd.Series(np.nan, index=df.index, dtype=object)
+    else:
+        raw = df[date_column]
+    dates = pd.to_datetime(raw, format='mixed', errors='coerce')
+    df[FINANCING_DATE] = dates
+    df[FINANCING_YEAR] = dates.dt.year.astype('Int64')
+    df[FINANCING_DATE_ISO] = dates.dt.strftime('%Y-%m-%d')
+    failed = raw.notna() & dates.isna()
+    return pd.DataFrame({'Companies': df.loc[failed, 'Companies'], 'value': raw[failed]})
@@ -0,0 +1,337 @@
+# service.py
+#
+# Local HTTP service for other tools: classification, NACE lookups and target matching answered
+# from an index of the B&B data that is built once and kept warm. The source workbooks are
+# polled, and a changed workbook is loaded into a new index that replaces the old one in a
+# single assignment, so every request sees one complete snapshot.
+#
+#   python -m bb_initiatives serve [--port 8765]
+#   curl 'http://127.0.0.1:8765/classify?description=R%C3%B8rlegger&rules=targets'
+
+import argparse
+import json
+import os
+import threading
+import time
+import traceback
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .classify import overview_classifier, target_classifier
+from .excel_cache import read_excel_cached
+from .investors import INVESTOR_ALIASES_FILE, INVESTORS_FILE, InvestorDimension, load_investor_aliases, read_investors
+from .nace_lookup import default_nace_lookup, get_subcategory_from_nace, map_nace_codes
+from .platforms_reader import PLATFORMS_FILE, PLATFORMS_HEADER_ROW, PLATFORMS_SHEET
+from .target_reader import TARGET_FILE, read_relevant_targets
+from .targets import build_subcategory_map, classify_platforms, find_investor_column, target_categories
+from .taxonomy import nace_to_subcategory_map
+
+SERVICE_HOST = '127.0.0.1'
+SERVICE_PORT = 8765
+# Seconds between checks of the source workbooks
+POLL_INTERVAL = 2.0
+
+# Subcategories whose targets the target mapping leaves out
+SKIP_SUBCATEGORIES = ('General',)
+
+
+class ServiceError(Exception):
+    """A request the service can't answer; `status` is the HTTP status code."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def source_fingerprint(paths):
+    """(path, mtime_ns, size) of each source file; None for files that don't exist."""
+    fingerprint = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            fingerprint.append((path, None, None))
+        else:
+            fingerprint.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+class ServiceIndex:
+    """One snapshot of the B&B data: acquirers by (Segment, Subcategory) and targets by name.
+
+    Built by `load`, never modified afterwards; all values are plain Python
+    objects, ready to be serialized as JSON.
+    """
+
+    def __init__(self, acquirers, targets, fingerprint, loaded_at):
+        self.acquirers = acquirers
+        self.targets = targets
+        self.fingerprint = fingerprint
+        self.loaded_at = loaded_at
+
+    @classmethod
+    def load(cls, bb_file=PLATFORMS_FILE, target_file=TARGET_FILE, aliases_file=INVESTOR_ALIASES_FILE, workers=1):
+        """Reads and indexes the workbooks, as the target mapping does."""
+        # Fingerprint first: a workbook changing while it is read is loaded again on the next poll
+        fingerprint = source_fingerprint((bb_file, INVESTORS_FILE, aliases_file, target_file))
+        classifier = target_classifier()
+        segment_categories, subcategory_categories = target_categories(classifier)
+
+        df_platforms = read_excel_cached(bb_file, header=PLATFORMS_HEADER_ROW - 1, sheet_name=PLATFORMS_SHEET)
+        investor_col_name = find_investor_column(df_platforms, bb_file)
+        classify_platforms(df_platforms, classifier, segment_categories, subcategory_categories, workers=workers)
+        investor_dimension = InvestorDimension.build(
+            df_platforms[investor_col_name], reference=read_investors(), aliases=load_investor_aliases(aliases_file)
+        )
+        subcategory_map = build_subcategory_map(df_platforms, investor_dimension, investor_col_name)
+        # Investor codes sort like the names, so each list is in investor name order
+        acquirers = {
+            (str(segment), str(subcategory)): [
+                {'investor': investor_dimension.names[code], 'companies': [str(c) for c in details['companies']],
+                 'count': details['count']}
+                for code, details in sorted(investors.items())
+            ]
+            for (segment, subcategory), investors in subcategory_map.items()
+        }
+
+        # The target register is optional; without it match-target only takes NACE codes
+        targets = {}
+        if os.path.exists(target_file):
+            df_target = read_relevant_targets(map_nace_codes, nace_to_subcategory_map, path=target_file)
+            for record in df_target.astype(object).where(df_target.notna(), None).to_dict('records'):
+                target = {key: record.get(key) for key in ('TargetName', 'NACE', 'Segment', 'Subcategory',
+                                                           'Score', 'Revenue', 'EBIT')}
+                targets.setdefault(str(target['TargetName']).casefold(), target)
+
+        return cls(acquirers, targets, fingerprint, datetime.now().isoformat(timespec='seconds'))
+
+    def acquirers_for(self, segment, subcategory):
+        """B&B investors with initiatives in the subcategory (all segments having it if `segment` is None)."""
+        if segment is not None:
+            return self.acquirers.get((segment, subcategory), [])
+        return [
+            dict(acquirer, segment=key[0])
+            for key, acquirers in self.acquirers.items() if key[1] == subcategory
+            for acquirer in acquirers
+        ]
+
+
+class ClassificationService:
+    """The request handlers, over the current ServiceIndex (reloaded when the workbooks change)."""
+
+    def __init__(self, bb_file=PLATFORMS_FILE, target_file=TARGET_FILE, aliases_file=INVESTOR_ALIASES_FILE,
+                 workers=1, poll_interval=POLL_INTERVAL):
+        self.bb_file = bb_file
+        self.target_file = target_file
+        self.aliases_file = aliases_file
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.reloads = 0
+        self.last_error = None
+        self._reload_lock = threading.Lock()
+        self._failed_fingerprint = None
+        # Compiled classifiers and the NACE table are built once, before the first request
+        overview_classifier().classify('', '')
+        target_classifier().classify('', '')
+        default_nace_lookup()
+        self.index = self._load()
+
+    def _sources(self):
+        return (self.bb_file, INVESTORS_FILE, self.aliases_file, self.target_file)
+
+    def _load(self):
+        return ServiceIndex.load(self.bb_file, self.target_file, self.aliases_file, workers=self.workers)
+
+    def reload_if_changed(self):
+        """Loads a new index if a source workbook changed; True if the index was replaced."""
+        with self._reload_lock:
+            fingerprint = source_fingerprint(self._sources())
+            if fingerprint in (self.index.fingerprint, self._failed_fingerprint):
+                return False
+            try:
+                index = self._load()
+            except Exception as e:
+                # Keep answering from the old index; a partly written workbook is retried once it changes again
+                self._failed_fingerprint = fingerprint
+                self.last_error = f"{type(e).__name__}: {e}"
+                print(f"Reload failed, still serving the data loaded at {self.index.loaded_at}: {self.last_error}")
+                return False
+            self.index = index
+            self.reloads += 1
+            self.last_error = None
+            print(f"Reloaded the B&B data ({len(index.acquirers)} subcategories, {len(index.targets)} targets).")
+            return True
+
+    def watch(self):
+        """Starts a daemon thread that polls the source workbooks every `poll_interval` seconds."""
+        def poll():
+            while True:
+                time.sleep(self.poll_interval)
+                self.reload_if_changed()
+
+        thread = threading.Thread(target=poll, name='workbook-watcher', daemon=True)
+        thread.start()
+        return thread
+
+    # --- Requests: each takes the query parameters (dict of str) and returns a JSON-serializable dict ---
+
+    def classify(self, params):
+        description = _param(params, 'description', required=True)
+        rules = _param(params, 'rules', default='overview')
+        if rules not in ('overview', 'targets'):
+            raise ServiceError("rules must be 'overview' or 'targets'")
+        classifier = target_classifier() if rules == 'targets' else overview_classifier()
+        segment, subcategory = classifier.classify(_param(params, 'keywords'), description)
+        return {'segment': segment, 'subcategory': subcategory}
+
+    def nace(self, params):
+        code = _param(params, 'code', required=True)
+        segment, subcategory = get_subcategory_from_nace(code)
+        return {'code': code, 'segment': segment, 'subcategory': subcategory}
+
+    def acquirers_for_subcategory(self, params):
+        subcategory = _param(params, 'subcategory', required=True)
+        segment = _param(params, 'segment')
+        acquirers = self.index.acquirers_for(segment, subcategory)
+        return {'segment': segment, 'subcategory': subcategory, 'acquirers': acquirers}
+
+    def match_target(self, params):
+        """Acquirers of a target of the register (`name`) or of any company with a NACE code (`nace`)."""
+        index = self.index
+        name = _param(params, 'name')
+        if name is not None:
+            target = index.targets.get(name.casefold())
+            if target is None:
+                raise ServiceError(f"No relevant target named {name!r} in '{self.target_file}'", status=404)
+            segment, subcategory = target['Segment'], target['Subcategory']
+        elif _param(params, 'nace') is not None:
+            target = None
+            segment, subcategory = get_subcategory_from_nace(params['nace'])
+        else:
+            raise ServiceError("Missing parameter 'name' or 'nace'")
+        # Like the target mapping: unmapped codes and 'General' subcategories have no acquirers
+        relevant = segment is not None and subcategory not in SKIP_SUBCATEGORIES
+        return {
+            'target': target, 'segment': segment, 'subcategory': subcategory, 'relevant': relevant,
+            'acquirers': index.acquirers_for(segment, subcategory) if relevant else [],
+        }
+
+    def status(self, params):
+        index = self.index
+        return {
+            'loaded_at': index.loaded_at, 'reloads': self.reloads, 'last_error': self.last_error,
+            'subcategories': len(index.acquirers), 'targets': len(index.targets),
+            'sources': [{'path': path, 'mtime_ns': mtime_ns, 'size': size} for path, mtime_ns, size in index.fingerprint],
+        }
+
+    def routes(self):
+        return {
+            '/classify': self.classify,
+            '/nace': self.nace,
+            '/acquirers-for-subcategory': self.acquirers_for_subcategory,
+            '/match-target': self.match_target,
+            '/status': self.status,
+        }
+
+
+def _param(params, name, default=None, required=False):
+    value = params.get(name)
+    if value is None or value == '':
+        if required:
+            raise ServiceError(f"Missing parameter '{name}'")
+        return default
+    return str(value)
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """GET with query parameters, or POST with a JSON object; answers with JSON."""
+
+    def _respond(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, params):
+        url = urlsplit(self.path)
+        handler = self.server.routes.get(url.path.rstrip('/') or '/')
+        if handler is None:
+            self._respond(404, {'error': f"Unknown path {url.path!r}", 'paths': sorted(self.server.routes)})
+            return
+        params = {**{key: values[-1] for key, values in parse_qs(url.query).items()}, **params}
+        try:
+            self._respond(200, handler(params))
+        except ServiceError as e:
+            self._respond(e.status, {'error': str(e)})
+        except Exception as e:
+            # Any other failure still gets a response (the server thread would drop the connection)
+            print(f"Error answering {self.command} {self.path}:")
+            traceback.print_exc()
+            self._respond(500, {'error': f"{type(e).__name__}: {e}"})
+
+    def do_GET(self):
+        self._handle({})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            params = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError as e:
+            self._respond(400, {'error': f"Invalid JSON: {e}"})
+            return
+        if not isinstance(params, dict):
+            self._respond(400, {'error': "Expected a JSON object"})
+            return
+        self._handle(params)
+
+    def log_message(self, format, *args):
+        if self.server.log_requests:
+            super().log_message(format, *args)
+
+
+def make_server(service, host=SERVICE_HOST, port=SERVICE_PORT, log_requests=False):
+    """HTTP server answering from `service` (call serve_forever() to run it)."""
+    server = ThreadingHTTPServer((host, port), ServiceRequestHandler)
+    server.daemon_threads = True
+    server.routes = service.routes()
+    server.log_requests = log_requests
+    return server
+
+
+def add_arguments(parser):
+    parser.add_argument('--host', default=SERVICE_HOST, help="Address to listen on (default: %(default)s).")
+    parser.add_argument('--port', type=int, default=SERVICE_PORT, help="Port to listen on (default: %(default)s).")
+    parser.add_argument('--poll-interval', type=float, default=POLL_INTERVAL,
+                        help="Seconds between checks of the source workbooks (default: %(default)s).")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Processes for classifying the B&B data on (re)load (default: 1).")
+    parser.add_argument('--investor-aliases', default=INVESTOR_ALIASES_FILE,
+                        help="JSON file of investor aliases (default: %(default)s, if present).")
+    parser.add_argument('--log-requests', action='store_true', help="Log every request to stderr.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local classification and target matching service.")
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    print(f"Loading B&B data from '{PLATFORMS_FILE}'...")
+    try:
+        service = ClassificationService(aliases_file=args.investor_aliases, workers=args.workers,
+                                        poll_interval=args.poll_interval)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        raise SystemExit(1)
+    service.watch()
+    server = make_server(service, args.host, args.port, log_requests=args.log_requests)
+    print(f"Serving on http://{args.host}:{server.server_address[1]} "
+          f"({', '.join(sorted(server.routes))}); Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,139 @@
+# target_reader.py
+
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+
+from .excel_cache import ExcelSidecar, iter_sheet_rows
+from .money import parse_money
+
+TARGET_FILE = 'main_target_framework.xlsx'
+TARGET_SHEET = 'Main'
+# 1-based row holding the column headers of the register export
+TARGET_HEADER_ROW = 4
+
+# Rows parsed per chunk before the NACE filter is applied
+CHUNK_ROWS = 10000
+
+# Standardized column names, in output order
+TARGET_COLUMNS = ['TargetName', 'NACE', 'Score', 'Revenue', 'EBIT']
+REQUIRED_TARGET_COLUMNS = ['TargetName', 'NACE', 'Score']
+# Financial columns are parsed as amounts in NOK thousands (the register's unit)
+MONEY_TARGET_COLUMNS = ['Revenue', 'EBIT']
+MONEY_TARGET_UNIT = 'k'
+
+
+def resolve_target_columns(headers):
+    """Maps the standardized target columns to the register's header names."""
+    target_cols_map = {}
+    for col in headers:
+        col_str = str(col)
+        col_lower = col_str.lower()
+
+        if 'juridisk selskapsnavn' in col_lower: target_cols_map['TargetName'] = col_str
+        elif 'nace-bransjekode' in col_lower: target_cols_map['NACE'] = col_str
+        elif 'total score' in col_lower: target_cols_map['Score'] = col_str
+        # Exact names of the 2023 financials (case-insensitive)
+        elif col_lower == 'sum driftsinnt., 2023': target_cols_map['Revenue'] = col_str
+        elif col_lower == 'driftsres., 2023': target_cols_map['EBIT'] = col_str
+    return target_cols_map
+
+
+class TargetFrameworkReader:
+    """Streams the target register and keeps only targets with a relevant NACE code.
+
+    The column map is resolved from the header row once. The sheet is then read
+    with openpyxl's read-only mode in chunks of `chunk_size` rows, and each chunk
+    goes through `nace_mapper` (NACE code Series -> Segment and Subcategory
+    sequences) as soon as it is parsed. Rows without a mapping or in one of
+    `skip_subcategories` are dropped right away, so only relevant targets are
+    ever held in a DataFrame.
+    """
+
+    def __init__(self, nace_mapper, path=TARGET_FILE, sheet_name=TARGET_SHEET, header_row=TARGET_HEADER_ROW,
+                 skip_subcategories=('General',), chunk_size=CHUNK_ROWS):
+        self.nace_mapper = nace_mapper
+        self.path = path
+        self.sheet_name = sheet_name
+        self.header_row = header_row
+        self.skip_subcategories = tuple(skip_subcategories)
+        self.chunk_size = chunk_size
+        self.columns_map = None  # Standardized name -> header name
+        self._columns = []
+        self.rows_read = 0
+        self.rows_unmapped = 0  # No (relevant) NACE mapping
+        self.rows_skipped = 0  # Mapped to one of skip_subcategories
+
+    def _resolve_header(self, names):
+        self.columns_map = resolve_target_columns(name for name in names if name)
+        missing = [col for col in REQUIRED_TARGET_COLUMNS if col not in self.columns_map]
+        if missing:
+            raise ValueError(f"Missing essential columns in target file: {missing}. Found headers: {[n for n in names if n]}")
+        self._columns = [col for col in TARGET_COLUMNS if col in self.columns_map]
+        positions = {}
+        for position, name in enumerate(names):
+            positions.setdefault(name, position)
+        return [positions[self.columns_map[col]] for col in self._columns]
+
+    def _filter_chunk(self, rows):
+        chunk = pd.DataFrame(rows, columns=self._columns)
+        for col in MONEY_TARGET_COLUMNS:
+            if col in chunk.columns:
+                chunk[col] = parse_money(chunk[col], unit=MONEY_TARGET_UNIT)
+        self.rows_read += len(chunk)
+
+        segments, subcategories = self.nace_mapper(chunk['NACE'])
+        chunk['Segment'] = segments
+        chunk['Subcategory'] = subcategories
+        mapped = chunk['Segment'].notna() & chunk['Subcategory'].notna()
+        relevant = mapped & ~chunk['Subcategory'].isin(self.skip_subcategories)
+        self.rows_unmapped += int((~mapped).sum())
+        self.rows_skipped += int((mapped & ~relevant).sum())
+        return chunk[relevant]
+
+    def __iter__(self):
+        rows = []
+        for row in iter_sheet_rows(self.path, self.sheet_name, self.header_row, self._resolve_header):
+            rows.append(row)
+            if len(rows) >= self.chunk_size:
+                yield self._filter_chunk(rows)
+                rows = []
+        if rows:
+            yield self._filter_chunk(rows)
+
+    def read(self):
+        """All relevant targets as one DataFrame, with the load statistics in `attrs['target_load']`."""
+        chunks = [chunk for chunk in self if len(chunk)]
+        if chunks:
+            df = pd.concat(chunks, ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=self._columns + ['Segment', 'Subcategory'])
+        for col in TARGET_COLUMNS:
+            if col not in df.columns:
+                df[col] = np.nan
+        df.attrs['target_load'] = {
+            'columns_map': self.columns_map,
+            'rows_read': self.rows_read,
+            'rows_unmapped': self.rows_unmapped,
+            'rows_skipped': self.rows_skipped,
+        }
+        return df
+
+
+def read_relevant_targets(nace_mapper, nace_rules, path=TARGET_FILE, sheet_name=TARGET_SHEET,
+                          skip_subcategories=('General',), chunk_size=CHUNK_ROWS):
+    """The relevant targets of the register, served from an Arrow sidecar when possible.
+
+    `nace_rules` is any JSON-serializable description of what `nace_mapper` does
+    (e.g. the NACE prefix map); its hash names the sidecar, so editing the rules
+    filters the register again.
+    """
+    reader = TargetFrameworkReader(nace_mapper, path=path, sheet_name=sheet_name,
+                                   skip_subcategories=skip_subcategories, chunk_size=chunk_size)
+    payload = json.dumps([nace_rules, list(skip_subcategories)], sort_keys=True, default=list)
+    rules_hash = hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+    sidecar = ExcelSidecar(path, sheet_name=sheet_name, header=TARGET_HEADER_ROW - 1, dropna=False,
+                           loader=reader.read, variant=f"relevant-{rules_hash}", columns=TARGET_COLUMNS)
+    return sidecar.read()
@@ -0,0 +1,237 @@
+# targets.py
+#
+# Target mapping pipeline: relevant targets of main_target_framework.xlsx (by NACE code) matched
+# to the B&B initiatives of their subcategory; writes potential_targets_overview.html and
+# mapped_targets_output.xlsx.
+
+import argparse
+
+import pandas as pd
+
+from .categories import as_categorical, taxonomy_categories
+from .classification_cache import open_classification_cache
+from .classify import target_classifier
+from .excel_cache import read_excel_cached
+from .investment_types import explode_investors
+from .investors import INVESTOR_ALIASES_FILE, INVESTORS_FILE, InvestorDimension, load_investor_aliases, read_investors
+from .memory_report import MemoryReport
+from .nace_lookup import map_nace_codes
+from .target_reader import read_relevant_targets
+from .targets_report import format_nok_thousands, set_number_locale, write_targets_html
+from .taxonomy import nace_to_subcategory_map
+
+
+def add_arguments(parser):
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Processes for keyword classification (default: all cores; 1 = serial). "
+                             "Small inputs are always classified serially.")
+    parser.add_argument('--investor-aliases', default=INVESTOR_ALIASES_FILE,
+                        help="JSON file of investor aliases, e.g. {\"EQT Partners\": \"EQT\"} (default: %(default)s, if present).")
+    parser.add_argument('--memory-report', action='store_true',
+                        help="Print the memory use (memory_usage(deep=True)) of each DataFrame after each stage.")
+
+
+def target_categories(classifier):
+    """Fixed category sets of the Segment/Subcategory columns: every label the taxonomy or the NACE mapping can produce."""
+    segment_categories = taxonomy_categories(
+        classifier.segment_labels, (segment for segment, _ in nace_to_subcategory_map.values())
+    )
+    subcategory_categories = taxonomy_categories(
+        classifier.subcategory_labels, (subcategory for _, subcategory in nace_to_subcategory_map.values())
+    )
+    return segment_categories, subcategory_categories
+
+
+def find_investor_column(df_platforms, bb_file):
+    """Name of the investors column of the B&B data (added empty, with a warning, if there is none)."""
+    # Find 'All investors' column more robustly
+    for col in df_platforms.columns:
+        col_str = str(col)
+        if 'investor' in col_str.lower():
+            return col_str
+    # Default if not found, but might cause issues later if column truly missing
+    investor_col_name = 'All investors'
+    if investor_col_name not in df_platforms.columns:
+        print(f"Warning: Could not find 'All investors' column in {bb_file}.")
+        df_platforms[investor_col_name] = '' # Add empty column to prevent key errors
+    return investor_col_name
+
+
+def classify_platforms(df_platforms, classifier, segment_categories, subcategory_categories, workers=None):
+    """Adds categorical Segment and Subcategory columns to the B&B data."""
+    # Reuse cached classifications for companies unchanged since the last run
+    classification_cache = open_classification_cache()
+    segments, subcategories = classifier.classify_frame(
+        df_platforms, cache=classification_cache, workers=workers
+    )
+    df_platforms['Segment'] = as_categorical(segments, segment_categories, index=df_platforms.index)
+    df_platforms['Subcategory'] = as_categorical(subcategories, subcategory_categories, index=df_platforms.index)
+    if classification_cache is not None:
+        print(f"Classification cache: {classification_cache.hits} reused, {classification_cache.misses} newly classified")
+        classification_cache.close()
+
+
+def build_subcategory_map(df_platforms, investor_dimension, investor_col_name):
+    """B&B initiatives by subcategory: {(Segment, Subcategory): {investor code: {'companies': [...], 'count': N}}}.
+
+    Investors of a subcategory are in order of first appearance (rows in sheet order, then the
+    investors of each row), as the original script listed them; investor_dimension.names turns
+    their codes back into names.
+    """
+    subcategory_map = {}
+    pairs = explode_investors(df_platforms, investor_dimension, investor_col_name)
+    pairs[['Subcategory', 'Companies']] = df_platforms[['Subcategory', 'Companies']].reindex(pairs.index)
+    pairs = pairs[pairs['Companies'].notna()]
+    # Distinct companies per investor per subcategory
+    investor_companies = (
+        pairs.groupby(['Segment', 'Subcategory', 'Investor code'], dropna=False, observed=True, sort=False)['Companies']
+        .unique()
+    )
+    for (segment, subcategory, investor_code), companies in investor_companies.items():
+        subcategory_map.setdefault((segment, subcategory), {})[investor_code] = {
+            'companies': sorted(companies),
+            'count': len(companies)
+        }
+    return subcategory_map
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Map potential targets to B&B initiatives.")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+def run(args):
+    """Runs the target mapping in the working directory (see add_arguments for `args`)."""
+    set_number_locale()
+    classifier = target_classifier()
+    memory_report = MemoryReport(enabled=args.memory_report)
+
+    segment_categories, subcategory_categories = target_categories(classifier)
+
+    print("Starting target mapping process...")
+
+    # 1. Load Target Data (including Revenue and EBIT)
+    target_file = 'main_target_framework.xlsx'
+    target_sheet = 'Main'
+    print(f"\nLoading target data from '{target_file}' sheet '{target_sheet}'...")
+    try:
+        # The register is streamed in chunks and filtered on NACE code as it is read, so only
+        # relevant targets are kept (and cached in an Arrow sidecar for later runs)
+        df_target = read_relevant_targets(map_nace_codes, nace_to_subcategory_map, path=target_file, sheet_name=target_sheet)
+        target_load = df_target.attrs['target_load']
+        target_cols_map = target_load['columns_map']
+        if 'Revenue' not in target_cols_map: print("Warning: Revenue column 'Sum driftsinnt., 2023' not found.")
+        if 'EBIT' not in target_cols_map: print("Warning: EBIT column 'Driftsres., 2023' not found.")
+
+        print(f"Loaded {len(df_target)} relevant target companies (read {target_load['rows_read']} rows).")
+        print("Target columns found and mapped:", target_cols_map)
+        memory_report.record('targets loaded', df_target=df_target)
+
+    except FileNotFoundError: print(f"Error: Target file '{target_file}' not found."); exit()
+    except ValueError as e: print(f"Error loading target data: {e}"); exit()
+    except Exception as e: print(f"An unexpected error occurred loading target data: {e}"); exit()
+
+    # 2. Load and Process B&B Platform/Addon Data
+    bb_file = 'B&B platforms and addons.xlsx'
+    print(f"\nLoading B&B data from '{bb_file}'...")
+    try:
+        # Empty rows/columns are dropped on load (cached in the workbook's Arrow sidecar)
+        df_platforms = read_excel_cached(bb_file, header=6, sheet_name='Data')
+
+        investor_col_name = find_investor_column(df_platforms, bb_file)
+
+        # Ensure base required columns exist
+        base_req = ['Companies', 'Keywords', 'Description']
+        if not all(c in df_platforms.columns for c in base_req):
+             raise ValueError(f"Missing base columns in {bb_file}: {[c for c in base_req if c not in df_platforms.columns]}")
+
+
+        print(f"Loaded {len(df_platforms)} platform/addon records.")
+        # Classify B&B companies
+        classify_platforms(df_platforms, classifier, segment_categories, subcategory_categories, workers=args.workers)
+        print("B&B data classified by Segment and Subcategory.")
+        memory_report.record('platforms classified', df_platforms=df_platforms)
+
+    except FileNotFoundError: print(f"Error: B&B file '{bb_file}' not found."); exit()
+    except ValueError as e: print(f"Error loading B&B data: {e}"); exit()
+    except Exception as e: print(f"An unexpected error occurred loading B&B data: {e}"); exit()
+
+
+    # 3. Prepare B&B Lookup Dictionary (Revised Structure)
+    print("Creating refined lookup dictionary for B&B initiatives...")
+    # One code per investor (normalized names, aliases resolved), joined with the B&B investors sheet
+    investors_sheet = read_investors()
+    if investors_sheet is None:
+        print(f"Warning: '{INVESTORS_FILE}' not found; investors are listed without their details.")
+    investor_dimension = InvestorDimension.build(
+        df_platforms[investor_col_name], reference=investors_sheet, aliases=load_investor_aliases(args.investor_aliases)
+    )
+    print(f"Investor dimension: {len(investor_dimension)} investors, {investor_dimension.matched} found in '{INVESTORS_FILE}'.")
+
+    subcategory_map = build_subcategory_map(df_platforms, investor_dimension, investor_col_name)
+    print("Created refined lookup dictionary.")
+
+
+    # 4. Process Targets: Apply NACE mapping, Filter, Calculate Score, Format Financials
+    print("\nProcessing target companies...")
+    # Targets without a relevant NACE mapping or in a 'General' subcategory were dropped while loading
+    df_target_filtered = df_target.copy()
+    df_target_filtered['Segment'] = as_categorical(df_target_filtered['Segment'], segment_categories)
+    df_target_filtered['Subcategory'] = as_categorical(df_target_filtered['Subcategory'], subcategory_categories)
+    print(f"Filtered targets: {len(df_target_filtered)} relevant companies found (out of {target_load['rows_read']}, removed {target_load['rows_skipped']} 'General' category).")
+
+
+    # Calculate Score & Format Financials safely using .loc on the filtered copy
+    df_target_filtered.loc[:, 'Score_Numeric'] = pd.to_numeric(df_target_filtered['Score'], errors='coerce').fillna(0)
+    df_target_filtered.loc[:, 'Exit Probability (%)'] = (df_target_filtered['Score_Numeric'].clip(0, 10) / 10 * 100).round(1)
+
+    # Apply formatting using the revised function
+    df_target_filtered.loc[:, 'Revenue (NOK k)'] = df_target_filtered['Revenue'].apply(format_nok_thousands)
+    df_target_filtered.loc[:, 'EBIT (NOK k)'] = df_target_filtered['EBIT'].apply(format_nok_thousands)
+
+    # 5. Match Targets to B&B Initiatives (Revised)
+    print("Matching targets to potential B&B acquirers...")
+    df_target_filtered.loc[:,'Potential Acquirers'] = df_target_filtered.apply(
+        lambda row: subcategory_map.get((row['Segment'], row['Subcategory']), {}), axis=1
+    )
+
+    # 6. Sort Data
+    df_final = df_target_filtered.sort_values('Exit Probability (%)', ascending=False)
+
+    memory_report.record('targets matched', df_target_filtered=df_target_filtered)
+
+    # Get unique subcategories *after* filtering for buttons
+    unique_subcategories = sorted(df_final['Subcategory'].unique())
+
+    print("Targets matched and sorted.")
+
+    # 7. Generate HTML Report (Revised)
+    print("\nGenerating HTML report 'potential_targets_overview.html'...")
+    output_html_file = 'potential_targets_overview.html'
+    try:
+        # Rows are written as they are rendered
+        write_targets_html(output_html_file, df_final, unique_subcategories, investor_dimension.names)
+        print(f"\nSuccessfully generated HTML report: '{output_html_file}'")
+    except Exception as e:
+        print(f"\nError writing HTML file: {e}")
+
+    # Optionally save the final mapped data to Excel/CSV
+    try:
+         output_excel_file = 'mapped_targets_output.xlsx'
+         cols_to_output = [
+              'TargetName', 'Segment', 'Subcategory',
+              'Revenue (NOK k)', 'EBIT (NOK k)', 'Exit Probability (%)',
+              'NACE', 'Score', 'Potential Acquirers' # Keep raw data for excel
+         ]
+         # Use df_final which has the filtered data and raw Potential Acquirers (keyed by investor name)
+         df_output = df_final[cols_to_output].copy()
+         df_output['Potential Acquirers'] = df_output['Potential Acquirers'].map(
+              lambda acquirers: {investor_dimension.names[code]: details for code, details in acquirers.items()}
+         )
+         df_output.to_excel(output_excel_file, index=False)
+         print(f"Mapped data also saved to '{output_excel_file}'")
+    except Exception as e:
+         print(f"Could not save Excel output: {e}")
+
+    memory_report.print_summary()
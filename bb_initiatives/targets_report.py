@@ -0,0 +1,274 @@
+# targets_report.py
+#
+# HTML rendering of the target mapping (potential_targets_overview.html), as a stream of fragments
+# from the templates below (f-strings, compiled once with the module); write_targets_html writes
+# them to disk as they are rendered.
+
+import datetime
+import locale  # For number formatting
+
+import pandas as pd
+
+from .html_writer import write_fragments
+
+
+def set_number_locale():
+    """Sets the locale used by format_nok_thousands (Norwegian separators when available)."""
+    try:
+        # Try setting to Norwegian Bokmål for typical separators
+        locale.setlocale(locale.LC_ALL, 'nb_NO.UTF-8')
+    except locale.Error:
+        try:
+            # Fallback to a generic English locale if Norwegian isn't available
+            locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
+        except locale.Error:
+            # Fallback if no locale setting works
+            print("Warning: Could not set locale for number formatting.")
+
+
+# --- Formatting Function --- (Revised)
+def format_nok_thousands(value):
+    """Formats a number (assumed to be in thousands) as NOK thousands string."""
+    if pd.isna(value):
+        return 'N/A'
+    try:
+        # Value is already in thousands, just format it
+        num = float(value)
+        formatted_num = locale.format_string("%.0f", num, grouping=True)
+        return f"NOK {formatted_num}k"
+    except (ValueError, TypeError):
+        # Handle cases where conversion to float fails
+        return 'N/A' # Changed from 'Invalid' to 'N/A'
+
+
+# Page up to the subcategory filter buttons
+_PAGE_HEAD = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Potential B&B Targets Overview</title>
+    <style>
+        :root { --primary: #2c3e50; --secondary: #34495e; --accent: #3498db; --light: #ecf0f1; --dark: #2c3e50; --success: #2ecc71; --warning: #f39c12; --danger: #e74c3c; }
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; background-color: #f4f7f6; color: var(--dark); font-size: 14px; }
+        .container { max-width: 1600px; margin: 20px auto; padding: 20px; background-color: #fff; box-shadow: 0 0 15px rgba(0,0,0,0.1); border-radius: 8px; }
+        header { background-color: var(--primary); color: white; padding: 1rem 0; margin-bottom: 1.5rem; text-align: center; border-radius: 8px 8px 0 0; }
+        h1 { margin: 0; font-size: 1.8rem; }
+        h2 { color: var(--primary); border-bottom: 2px solid var(--accent); padding-bottom: 5px; margin-top: 1.5rem; margin-bottom: 1rem; font-size: 1.4rem; }
+        .filter-container { margin-bottom: 1.5rem; padding-bottom: 1rem; border-bottom: 1px solid #eee; }
+        .filter-container button { background-color: #e9ecef; border: 1px solid #ced4da; color: var(--dark); padding: 6px 12px; margin: 0 4px 4px 0; border-radius: 4px; cursor: pointer; transition: background-color 0.2s; font-size: 0.85rem; }
+        .filter-container button.active { background-color: var(--accent); color: white; border-color: var(--accent); font-weight: bold; }
+        .filter-container button:hover { background-color: #dee2e6; }
+        .filter-container button.active:hover { background-color: #2980b9; }
+        table { width: 100%; border-collapse: collapse; margin-top: 1rem; }
+        th, td { border: 1px solid #ddd; padding: 8px 10px; text-align: left; vertical-align: top; }
+        th { background-color: var(--secondary); color: white; white-space: nowrap; }
+        tr.filtered-out { display: none; } /* Class to hide rows */
+        tr:nth-child(even) { background-color: #f9f9f9; }
+        /* tr:hover { background-color: #f1f1f1; } */ /* Can be distracting with filtering */
+        .score { font-weight: bold; text-align: right; white-space: nowrap; }
+        .score-bar-container { width: 80px; height: 12px; background-color: #e0e0e0; border-radius: 3px; overflow: hidden; display: inline-block; vertical-align: middle; margin-left: 5px; }
+        .score-bar { height: 100%; background-color: var(--success); border-radius: 3px 0 0 3px; transition: width 0.5s ease-in-out; }
+
+        /* Acquirer List Styling */
+        .acquirer-cell { position: relative; } /* Container for list and toggle button */
+        .acquirer-list-wrapper { max-height: 8em; /* Approx 6 lines */ overflow: hidden; transition: max-height 0.3s ease-out; }
+        .acquirer-list-wrapper.expanded { max-height: 1000px; /* Allow full expansion */ transition: max-height 0.5s ease-in; }
+        .acquirer-list-wrapper ul { margin: 0; padding-left: 0; list-style-type: none; }
+        .acquirer-list-wrapper > ul > li { margin-bottom: 8px; } /* Space between investors */
+        .acquirer-list-wrapper strong { color: var(--primary); }
+        .acquirer-list-wrapper .investor-companies ul { margin: 2px 0 0 15px; padding: 0; list-style-type: disc; }
+        .acquirer-list-wrapper .investor-companies li { margin-bottom: 2px; font-size: 0.9em; }
+        .toggle-acquirers { display: none; /* Hidden by default */ cursor: pointer; color: var(--accent); font-size: 0.85em; margin-top: 5px; text-decoration: underline; }
+        .acquirer-list-wrapper.overflowing + .toggle-acquirers { display: block; /* Show only if needed */ }
+
+        .no-match { color: #888; font-style: italic; }
+        .financials { text-align: right; white-space: nowrap; }
+        .footer { text-align: center; margin-top: 2rem; padding-top: 1rem; border-top: 1px solid #eee; font-size: 0.85rem; color: #777; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <header><h1>Potential Buy & Build Targets</h1></header>
+
+        <h2>Filter by Subcategory</h2>
+        <div class="filter-container">
+            <button class="filter-button active" data-subcategory="all">Show All</button>
+"""
+
+# Between the filter buttons and the table rows
+_TABLE_HEAD = """
+        </div>
+
+        <h2>Targets Mapped to B&B Subcategories (Sorted by Exit Probability)</h2>
+        <table id="targets-table">
+            <thead>
+                <tr>
+                    <th>#</th>
+                    <th>Target Company</th>
+                    <th>Segment</th>
+                    <th data-column="subcategory">Subcategory</th>
+                    <th>Revenue (NOK k)</th>
+                    <th>EBIT (NOK k)</th>
+                    <th>Exit Probability (%)</th>
+                    <th>Potential Acquirers</th>
+                </tr>
+            </thead>
+            <tbody>
+    """
+
+_NO_TARGETS_ROW = '<tr><td colspan="8" style="text-align:center; padding: 20px;">No relevant targets found matching the criteria (after filtering).</td></tr>'
+
+_NO_ACQUIRERS_CELL = '<span class="no-match">None found</span>'
+
+# Table end and footer, up to the report timestamp
+_PAGE_FOOT_START = """
+            </tbody>
+        </table>
+        <div class="footer">
+            Report generated on: """
+
+# Rest of the footer and the filtering/toggling script
+_PAGE_FOOT_END = """ <br>
+            Targets from 'main_target_framework.xlsx', B&B data from 'B&B platforms and addons.xlsx'.
+        </div>
+    </div>
+
+    <script>
+        // Subcategory Filtering
+        const filterButtons = document.querySelectorAll('.filter-button');
+        const tableRows = document.querySelectorAll('#targets-table tbody tr');
+
+        filterButtons.forEach(button => {
+            button.addEventListener('click', () => {
+                const targetSubcategory = button.getAttribute('data-subcategory');
+                filterButtons.forEach(btn => btn.classList.remove('active'));
+                button.classList.add('active');
+                tableRows.forEach(row => {
+                    if (row.hasAttribute('data-subcategory')) {
+                        const rowSubcategory = row.getAttribute('data-subcategory');
+                        row.classList.toggle('filtered-out', !(targetSubcategory === 'all' || rowSubcategory === targetSubcategory));
+                    }
+                });
+            });
+        });
+
+        // Acquirer List Toggling
+        document.addEventListener('DOMContentLoaded', () => {
+            document.querySelectorAll('.acquirer-list-wrapper').forEach(wrapper => {
+                // Check if content overflows the max-height
+                if (wrapper.scrollHeight > wrapper.offsetHeight) {
+                    wrapper.classList.add('overflowing'); // Mark as overflowing to show button via CSS
+                }
+            });
+
+            document.querySelectorAll('.toggle-acquirers').forEach(toggleLink => {
+                toggleLink.addEventListener('click', (event) => {
+                    event.preventDefault(); // Prevent jumping to top
+                    const wrapper = toggleLink.previousElementSibling; // The .acquirer-list-wrapper
+                    const isExpanded = wrapper.classList.contains('expanded');
+
+                    wrapper.classList.toggle('expanded');
+                    toggleLink.textContent = isExpanded ? 'Show More...' : 'Show Less';
+                });
+            });
+        });
+    </script>
+</body>
+</html>
+    """
+
+
+def _filter_button(subcategory):
+    """Filter button of one subcategory."""
+    return f'            <button class="filter-button" data-subcategory="{subcategory}">{subcategory}</button>\n'
+
+
+def _acquirer_item(investor, count, plural, company_items):
+    """One potential acquirer (investor) and its companies in the subcategory."""
+    return f"""
+                        <li>
+                            <strong>{investor}</strong> ({count} investment{plural} in subcategory):
+                            <div class="investor-companies">
+                                <ul>{company_items}</ul>
+                            </div>
+                        </li>"""
+
+
+def _target_row(number, target_name, segment, subcategory, revenue, ebit, score_val, score_color, acquirers_cell_content):
+    """One target (`number` counts from 1 in the sorted order)."""
+    return f"""
+                <tr data-subcategory="{subcategory}">
+                    <td>{number}</td>
+                    <td>{target_name}</td>
+                    <td>{segment}</td>
+                    <td>{subcategory}</td>
+                    <td class="financials">{revenue}</td>
+                    <td class="financials">{ebit}</td>
+                    <td class="score">
+                        {score_val}%
+                        <div class="score-bar-container">
+                           <div class="score-bar" style="width: {score_val}%; background-color: {score_color};"></div>
+                        </div>
+                    </td>
+                    <td class="acquirer-cell">{acquirers_cell_content}</td>
+                </tr>
+            """
+
+
+def _score_color(score_val):
+    if score_val >= 70: return 'var(--success)'
+    elif score_val >= 40: return 'var(--warning)'
+    else: return 'var(--danger)'
+
+
+def _acquirers_cell(acquirers_data, investor_names):
+    if not acquirers_data:
+        return _NO_ACQUIRERS_CELL
+    items = []
+    for investor_code in sorted(acquirers_data):
+        details = acquirers_data[investor_code]
+        count = details['count']
+        items.append(_acquirer_item(
+            investor_names[investor_code], count, 's' if count > 1 else '',
+            ''.join(f'<li>{c}</li>' for c in details['companies']),
+        ))
+    # The list in a wrapper, with a toggle link shown when it overflows
+    return f'<div class="acquirer-list-wrapper"><ul class="acquirer-list">{"".join(items)}</ul></div><a href="#" class="toggle-acquirers">Show More...</a>'
+
+
+def render_targets_fragments(df_final, unique_subcategories, investor_names):
+    """The targets page as a stream of fragments: subcategory filter buttons and one table row per
+    target of `df_final` (already sorted), with its potential acquirers (investor codes -> `investor_names`)."""
+    yield _PAGE_HEAD
+    # Add buttons for each unique subcategory (excluding General)
+    for subcategory in unique_subcategories:
+        yield _filter_button(subcategory)
+    yield _TABLE_HEAD
+
+    if df_final.empty:
+        yield _NO_TARGETS_ROW
+    else:
+        columns = ['TargetName', 'Segment', 'Subcategory', 'Revenue (NOK k)', 'EBIT (NOK k)',
+                   'Exit Probability (%)', 'Potential Acquirers']
+        rows = zip(*(df_final[column] for column in columns))
+        for number, (target_name, segment, subcategory, revenue, ebit, score_val, acquirers_data) in enumerate(rows, 1):
+            yield _target_row(
+                number, target_name, segment, subcategory, revenue, ebit, score_val, _score_color(score_val),
+                _acquirers_cell(acquirers_data, investor_names),
+            )
+
+    yield _PAGE_FOOT_START
+    yield datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    yield _PAGE_FOOT_END
+
+
+def render_targets_html(df_final, unique_subcategories, investor_names):
+    """The targets page as one string (see render_targets_fragments)."""
+    return ''.join(render_targets_fragments(df_final, unique_subcategories, investor_names))
+
+
+def write_targets_html(path, df_final, unique_subcategories, investor_names):
+    """Writes the targets page to `path` as it is rendered (see render_targets_fragments)."""
+    return write_fragments(path, render_targets_fragments(df_final, unique_subcategories, investor_names))
@@ -0,0 +1,233 @@
+# taxonomy.py
+#
+# The construction-sector taxonomy shared by the B&B overview and the target mapping:
+# segment keywords, subcategory keywords and the NACE code mapping. Plain data, no I/O.
+
+# Define the segments and their associated keywords
+segments_data = {
+    'Core Construction & Civil Engineering': [
+        'construction company', 'construction work', 'construction services', 
+        'construction contractor', 'construction operation', 'construction project',
+        'contracting services', 'excavation work', 'groundwork service',
+        'demolition services', 'road construction', 'tunneling', 'rock blasting',
+        'builder services', 'building developer', 'house builder', 
+        'house construction', 'residential construction', 'modular buildings',
+        'real estate development', 'property development', 'property maintenance',
+        'property management', 'property renovation'
+    ],
+    
+    'Specialized Trades': [
+        'flooring services', 'floor leveling', 'tiling', 'tiles work',
+        'tiles laying', 'flooring company', 'floor treatment',
+        'carpentry work', 'carpentry products', 'painting services',
+        'painting provider', 'wall tiles', 'surface layering',
+        'roofing services', 'roofing system', 'roofing maintenance',
+        'pitched roof', 'flat roof'
+    ],
+    
+    'Mechanical, Electrical & HVAC': [
+        'electrical installation', 'electrical engineering', 'electrical contractor',
+        'power installation', 'lighting systems', 'hvac services', 'heating system',
+        'ventilation system', 'air-treatment installation', 'indoor climate',
+        'plumbing services', 'pipe installation', 'drainage systems',
+        'geothermal heating'
+    ],
+    
+    'Marine, Offshore & Energy': [
+        'diving & salvage', 'marine construction', 'marine survey',
+        'hydrographic survey', 'offshore unit', 'oil and gas support',
+        'oil and gas pipe', 'oil and gas investment', 'solar energy',
+        'energy efficiency', 'renewable energy', 'energy consulting'
+    ],
+    
+    'Industrial Services & Manufacturing Support': [
+        'welding services', 'steel cutting', 'forging', 'machining',
+        'rotating equipment maintenance', 'concrete pumping', 'precast concrete',
+        'foam concrete', 'concrete technology', 'concrete renovation',
+        'machine control', 'process plant maintenance', 'repair and maintenance'
+    ],
+    
+    'Building Products & Materials': [
+        'building materials', 'modular walls', 'glass walls',
+        'fire retardant wood', 'surface materials', 'insulation',
+        'prefabricated housing', 'green construction materials',
+        'constructional material'
+    ],
+    
+    'Tech & Software for Construction': [
+        'project management system', 'construction management software',
+        'online collaboration', 'bim', '3d modeling', 'reverse engineering',
+        'smart building systems'
+    ],
+    
+    'Consulting, Advisory & Project Management': [
+        'construction consulting', 'engineering consulting', 'financial advisory',
+        'spatial planning', 'architectural consultancy', 'design management',
+        'project planning', 'cost estimation', 'technical consulting',
+        'environmental consulting', 'geotechnical consulting', 'remediation services'
+    ],
+    
+    'Equipment Rental & Heavy Machinery': [
+        'machinery rental', 'construction equipment', 'crane trucks',
+        'scaffolding', 'automation machinery', 'heavy equipment services',
+        'pipeline services', 'construction machines repair'
+    ],
+    
+    'Facility Services & Real Estate Ops': [
+        'building automation', 'smart buildings', 'energy management systems',
+        'property tech', 'maintenance services', 'damage restoration',
+        'dehumidification', 'climate control', 'insurance claims',
+        'remediation', 'fire & water damage control'
+    ],
+    
+    'Safety & Monitoring Systems': [
+        'alarm systems', 'surveillance', 'access control', 'fire safety',
+        'radon mitigation', 'system installations'
+    ],
+    
+    'Environmental & Waste Management': [
+        'waste management', 'land remediation', 'environmental services',
+        'asbestos removal', 'soil mixing', 'decontamination'
+    ],
+    
+    'Infrastructure & Public Works': [
+        'infrastructure construction', 'road development', 'railway development',
+        'traffic systems', 'public facility works'
+    ],
+    
+    'Interior Design & Furnishing': [
+        'interior services', 'office decor', 'store design',
+        'modular interiors', 'window and furnishing installation'
+    ]
+}
+
+# Subcategories with their own keywords (matched within the company's segment)
+_specific_subcategory_keywords = {
+    'Mechanical, Electrical & HVAC': {
+        'HVAC': ['hvac', 'ventilation', 'air', 'climate', 'cooling'],
+        'Electrical': ['electrical', 'power', 'lighting', 'elektro'],
+        'Plumbing': ['plumbing', 'pipe', 'drainage', 'sanitary'],
+        'Heating': ['heating', 'geothermal', 'heat pump', 'boiler']
+    },
+    'Core Construction & Civil Engineering': {
+        'Civil Engineering': ['civil engineering', 'infrastructure', 'road', 'tunnel', 'excavation', 'groundwork'],
+        'Building Construction': ['building', 'construction company', 'house builder', 'residential'],
+        'Property Services': ['property', 'real estate', 'renovation', 'maintenance']
+    },
+    'Specialized Trades': {
+        'Flooring': ['floor', 'tiling', 'tiles'],
+        'Carpentry': ['carpentry', 'wood', 'timber'],
+        'Roofing': ['roof', 'roofing'],
+        'Painting': ['paint', 'coating', 'surface']
+    },
+    'Industrial Services & Manufacturing Support': {
+        'Welding & Metalwork': ['welding', 'steel', 'metal', 'forging'],
+        'Concrete': ['concrete', 'cement'],
+        'Maintenance': ['maintenance', 'repair', 'service']
+    }
+}
+
+# Norwegian keywords the target register is matched on as well, appended per subcategory
+_norwegian_subcategory_keywords = {
+    'Mechanical, Electrical & HVAC': {
+        'HVAC': ['varme', 'kjøling'],
+        'Plumbing': ['rørlegger'],
+        'Heating': ['oppvarming'],
+    },
+    'Core Construction & Civil Engineering': {
+        'Civil Engineering': ['anlegg', 'vei', 'grunnarbeid'],
+        'Building Construction': ['bygge', 'entreprenør'],
+        'Property Services': ['eiendom', 'rehabilitering', 'vedlikehold'],
+    },
+    'Specialized Trades': {
+        'Flooring': ['gulv', 'flis'],
+        'Carpentry': ['tømrer', 'snekker'],
+        'Roofing': ['tak'],
+        'Painting': ['male', 'overflate'],
+    },
+    'Industrial Services & Manufacturing Support': {
+        'Welding & Metalwork': ['sveising', 'stål', 'metall'],
+        'Concrete': ['betong'],
+        'Maintenance': ['vedlikehold', 'reparasjon'],
+    },
+}
+
+
+def _overview_subcategory_keywords():
+    """Subcategories of the B&B overview: segments without their own get a 'General'
+    subcategory keyed on the full segment name."""
+    table = {segment: dict(subcategories) for segment, subcategories in _specific_subcategory_keywords.items()}
+    for segment in segments_data:
+        if segment not in table:
+            table[segment] = {'General': [segment.lower()]}
+    return table
+
+
+def _target_subcategory_keywords():
+    """Subcategories of the target mapping: English and Norwegian keywords, and a 'General'
+    subcategory (keyed on the first word of the segment name) in every segment."""
+    table = {
+        segment: {
+            name: keywords + _norwegian_subcategory_keywords.get(segment, {}).get(name, [])
+            for name, keywords in subcategories.items()
+        }
+        for segment, subcategories in _specific_subcategory_keywords.items()
+    }
+    for segment in segments_data:
+        subcategories = table.setdefault(segment, {})
+        if 'General' not in subcategories:
+            subcategories['General'] = [segment.split(' ')[0].lower()]
+    return table
+
+
+# Subcategory keywords of the B&B overview (segment_classification) ...
+subcategory_keywords = _overview_subcategory_keywords()
+# ... and of the target mapping (map_targets_to_bb)
+target_subcategory_keywords = _target_subcategory_keywords()
+
+# --- NACE Code to Subcategory Mapping ---
+# Mapping NACE prefixes to (Segment, Subcategory) tuples
+# Based on NACE Rev. 2 and the subcategories defined above
+nace_to_subcategory_map = {
+    # F - CONSTRUCTION
+    '41': ('Core Construction & Civil Engineering', 'Building Construction'),
+    '42': ('Core Construction & Civil Engineering', 'Civil Engineering'),
+    '43.1': ('Core Construction & Civil Engineering', 'Civil Engineering'), # Demolition, site prep
+    '43.21': ('Mechanical, Electrical & HVAC', 'Electrical'),
+    '43.22': ('Mechanical, Electrical & HVAC', 'HVAC'), # Plumbing, heat, air-con
+    '43.29': ('Specialized Trades', 'General'), # Other installation
+    '43.31': ('Specialized Trades', 'Painting'), # Plastering often related
+    '43.32': ('Specialized Trades', 'Carpentry'), # Joinery
+    '43.33': ('Specialized Trades', 'Flooring'), # Floor and wall covering
+    '43.34': ('Specialized Trades', 'Painting'), # Painting and glazing
+    '43.39': ('Specialized Trades', 'General'), # Other completion
+    '43.91': ('Specialized Trades', 'Roofing'),
+    '43.99': ('Specialized Trades', 'General'), # Other specialized activities (scaffolding etc.)
+
+    # M - PROFESSIONAL, SCIENTIFIC AND TECHNICAL ACTIVITIES
+    '71.11': ('Consulting, Advisory & Project Management', 'General'), # Architectural activities
+    '71.12': ('Consulting, Advisory & Project Management', 'General'), # Engineering activities & consultancy
+    '71.2': ('Consulting, Advisory & Project Management', 'General'), # Technical testing and analysis
+
+    # N - ADMINISTRATIVE AND SUPPORT SERVICE ACTIVITIES
+    '77.32': ('Equipment Rental & Heavy Machinery', 'General'), # Renting construction machinery
+    '81.1': ('Facility Services & Real Estate Ops', 'General'), # Combined facilities support
+    '81.29': ('Facility Services & Real Estate Ops', 'General'), # Other building and industrial cleaning (can include exterior etc)
+    '81.3': ('Facility Services & Real Estate Ops', 'General'), # Landscape service activities
+
+    # C - MANUFACTURING
+    '23.5': ('Building Products & Materials', 'General'), # Cement, lime, plaster
+    '23.6': ('Industrial Services & Manufacturing Support', 'Concrete'), # Concrete, plaster, cement products
+    '23.7': ('Building Products & Materials', 'General'), # Cutting, shaping stone
+    '25.1': ('Industrial Services & Manufacturing Support', 'Welding & Metalwork'), # Structural metal products
+    '32.99': ('Building Products & Materials', 'General'), # Other manufacturing n.e.c. (can include signs etc)
+
+    # E - WATER SUPPLY; SEWERAGE, WASTE MANAGEMENT AND REMEDIATION ACTIVITIES
+    '37': ('Core Construction & Civil Engineering', 'Civil Engineering'), # Sewerage (often infrastructure related)
+    '38': ('Environmental & Waste Management', 'General'), # Waste collection, treatment
+    '39': ('Environmental & Waste Management', 'General'), # Remediation activities
+
+    # G - WHOLESALE TRADE
+    '46.73': ('Building Products & Materials', 'General'), # Wholesale of wood, construction materials
+    '46.74': ('Building Products & Materials', 'General'), # Wholesale of hardware, plumbing and heating equipment
+}
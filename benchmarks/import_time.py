@@ -0,0 +1,82 @@
+# import_time.py
+#
+# Startup budget of the lightweight entry points. Each case runs in a fresh interpreter
+# (best of --repeat runs) and must stay within its budget without importing pandas or numpy.
+#
+#   python benchmarks/import_time.py [--repeat 5] [--scale 1.0]
+#
+# Exits with status 1 if any case is over budget or imports a heavy module.
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ('pandas', 'numpy')
+
+# Case name, Python code run by the fresh interpreter, budget in milliseconds (interpreter startup included)
+CASES = [
+    ('import bb_initiatives', "import bb_initiatives", 100),
+    ('import bb_initiatives.classify', "import bb_initiatives.classify", 100),
+    ('import segment_classification', "import segment_classification", 100),
+    ('import map_targets_to_bb', "import map_targets_to_bb", 100),
+    ('cli classify-text', "from bb_initiatives import cli; "
+                          "cli.main(['classify-text', 'Rørlegger og VVS-tjenester', '--rules', 'targets'])", 150),
+    ('import classify_companies', "from bb_initiatives import classify_companies", 100),
+    ('cli nace-lookup', "from bb_initiatives import cli; cli.main(['nace-lookup', '43.22', '41.201'])", 150),
+]
+
+# Appended to each case: fails the run if a heavy module was imported
+CHECK_HEAVY = (
+    "\nimport sys as _sys"
+    "\n_heavy = [m for m in {modules!r} if m in _sys.modules]"
+    "\nif _heavy: raise SystemExit('imported ' + ', '.join(_heavy))"
+)
+
+
+def time_case(code, repeat):
+    """Best wall time (seconds) of `code` in a fresh interpreter; raises RuntimeError if it fails."""
+    script = code + CHECK_HEAVY.format(modules=HEAVY_MODULES)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', script], cwd=ROOT, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError((result.stderr or result.stdout).strip().splitlines()[-1])
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startup time of the lightweight entry points.")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per case; the best is kept (default: 5).")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Multiplier of all budgets, for slower machines (default: 1.0).")
+    args = parser.parse_args(argv)
+
+    baseline = time_case("pass", args.repeat)
+    print(f"{'case':<34}{'time':>10}{'budget':>10}")
+    print(f"{'python -c pass':<34}{baseline * 1000:>8.1f}ms")
+
+    failures = 0
+    for name, code, budget_ms in CASES:
+        budget_ms *= args.scale
+        try:
+            elapsed_ms = time_case(code, args.repeat) * 1000
+        except RuntimeError as error:
+            print(f"{name:<34}{'FAILED':>10}{budget_ms:>8.0f}ms  {error}")
+            failures += 1
+            continue
+        status = '' if elapsed_ms <= budget_ms else '  OVER BUDGET'
+        failures += bool(status)
+        print(f"{name:<34}{elapsed_ms:>8.1f}ms{budget_ms:>8.0f}ms{status}")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
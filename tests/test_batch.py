@@ -0,0 +1,23 @@
+import io
+
+from bb_initiatives.batch import classify_companies, read_csv_records
+
+
+def test_blank_ids_fall_back_to_the_record_position():
+    stream = io.StringIO(
+        "Company ID,Keywords,Description\n"
+        "C1,,Provider of electrical installation services\n"
+        ",,Provider of plumbing services\n"
+        ",,Provider of roofing services\n"
+    )
+    records = list(read_csv_records(stream))
+    assert records[1]['Company ID'] is None
+
+    ids = [record_id for record_id, _, _ in classify_companies(records, batch_size=2)]
+    assert ids == ['C1', 1, 2]
+
+
+def test_empty_string_ids_fall_back_to_the_record_position():
+    records = [{'Company ID': '', 'Description': 'Provider of plumbing services'}, {'Description': 'Roofing'}]
+    ids = [record_id for record_id, _, _ in classify_companies(records)]
+    assert ids == [0, 1]
@@ -0,0 +1,52 @@
+import os
+
+import openpyxl
+import pytest
+
+from bb_initiatives import excel_cache
+from bb_initiatives.excel_cache import SIDECAR_DIR, ExcelSidecar
+
+pytest.importorskip('pyarrow')
+
+
+def _workbook(path, rows):
+    workbook = openpyxl.Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    workbook.save(path)
+    return str(path)
+
+
+def _sidecars(directory):
+    cache = os.path.join(directory, SIDECAR_DIR)
+    return sorted(name for name in os.listdir(cache) if name.endswith('.arrow')) if os.path.isdir(cache) else []
+
+
+def test_mixed_type_column_is_cached_as_text(tmp_path, capsys):
+    path = _workbook(tmp_path / 'scores.xlsx', [['Name', 'Score'], ['A', 3], ['B', 'x'], ['C', None]])
+
+    first = ExcelSidecar(path).read()
+    assert 'Warning' not in capsys.readouterr().out
+    assert len(_sidecars(tmp_path)) == 1
+    assert first['Score'].tolist()[:2] == ['3', 'x'] and first['Score'].isna().tolist() == [False, False, True]
+
+    second = ExcelSidecar(path, loader=lambda: pytest.fail("workbook parsed again")).read()
+    assert second.equals(first)
+
+
+def test_sidecar_of_another_format_or_projection_is_rebuilt(tmp_path, monkeypatch):
+    path = _workbook(tmp_path / 'plain.xlsx', [['Name', 'Score'], ['A', 1]])
+    ExcelSidecar(path, columns=['Name']).read()
+    parses = []
+
+    def loader():
+        parses.append(1)
+        return excel_cache._read_clean(path, 0, 0, True, 'openpyxl')
+
+    ExcelSidecar(path, columns=['Name'], loader=loader).read()
+    assert parses == []
+    ExcelSidecar(path, columns=['Name', 'Score'], loader=loader).read()
+    assert parses == [1]
+    monkeypatch.setattr(excel_cache, 'SIDECAR_FORMAT_VERSION', excel_cache.SIDECAR_FORMAT_VERSION + 1)
+    ExcelSidecar(path, columns=['Name', 'Score'], loader=loader).read()
+    assert parses == [1, 1]
@@ -0,0 +1,63 @@
+import datetime
+import os
+
+import openpyxl
+import pytest
+
+from bb_initiatives import platforms_reader
+from bb_initiatives.excel_cache import SIDECAR_DIR
+from bb_initiatives.platforms_reader import (FINANCING_YEAR, PLATFORMS_HEADER_ROW, PLATFORMS_SHEET, PlatformsReader,
+                                             add_financing_dates, date_cells, read_platforms)
+
+pytest.importorskip('pyarrow')
+
+HEADER = ['Company ID', 'Companies', 'All investors', 'Keywords', 'Description', 'Last financing date']
+
+
+def _platforms_workbook(path, rows):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = PLATFORMS_SHEET
+    for _ in range(PLATFORMS_HEADER_ROW - 1):
+        sheet.append([])
+    sheet.append(HEADER)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+    return str(path)
+
+
+def test_mixed_date_cells_are_cached_on_the_first_run(tmp_path, monkeypatch, capsys):
+    path = _platforms_workbook(tmp_path / 'platforms.xlsx', [
+        ['C1', 'Alpha', 'EQT', 'roofing', 'Roofing services', datetime.datetime(2020, 1, 15)],
+        ['C2', 'Beta', 'Adelis', 'plumbing', 'Plumbing services', '2021-05-03'],
+    ])
+
+    first = read_platforms(path)
+    assert 'Warning' not in capsys.readouterr().out
+    assert any(name.endswith('.platforms.arrow') for name in os.listdir(tmp_path / SIDECAR_DIR))
+    assert first['Last financing date'].tolist() == ['2020-01-15T00:00:00', '2021-05-03']
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("workbook parsed again")
+
+    monkeypatch.setattr(platforms_reader, 'iter_sheet_rows', no_parse)
+    second = read_platforms(path)
+    assert second.equals(first)
+
+    assert add_financing_dates(second, 'Last financing date').empty
+    assert second[FINANCING_YEAR].tolist() == [2020, 2021]
+    assert date_cells(second['Last financing date']).tolist() == [datetime.datetime(2020, 1, 15), '2021-05-03']
+
+
+def test_read_matches_the_batches(tmp_path):
+    rows = [[f'C{i}', f'Company {i}', 'EQT', '', f'Company number {i}', datetime.datetime(2020, 1, 1 + i % 28)]
+            for i in range(23)]
+    path = _platforms_workbook(tmp_path / 'platforms.xlsx', rows)
+    reader = PlatformsReader(path, batch_size=5)
+    batches = list(reader)
+    assert [len(batch) for batch in batches] == [5, 5, 5, 5, 3]
+    frame = PlatformsReader(path, batch_size=5).read()
+    assert frame.index.tolist() == list(range(23))
+    assert frame['Companies'].tolist() == [row[1] for row in rows]
+    assert frame['Last financing date'].tolist() == [value for batch in batches for value in batch['Last financing date']]